@@ -41,6 +41,28 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
 
+    """
+    Compresión de respuestas
+    """
+    compresion_tamano_minimo: int = 1000
+    compresion_nivel: int = 6
+
+    """
+    Transmisión en vivo
+    """
+    en_vivo_maxlen: int = 1000  # mensajes guardados por stream
+    en_vivo_cola: int = 100  # mensajes pendientes por conexión
+    en_vivo_keepalive: int = 15  # segundos entre pings
+    en_vivo_timeout_envio: int = 10  # segundos antes de cortar un cliente
+    contexto_partido_ttl: int = 3 * 60 * 60  # segundos
+
+    """
+    Reglas de competencia
+    """
+    duracion_partido: int = 90
+    amarillas_por_suspension: int = 5
+    partidos_forma: int = 5
+
     # Cloudflare R2
     r2_account_id: str = ""
     r2_access_key_id: str = ""
@@ -1,8 +1,10 @@
 # pylint: disable=E0401,E0611
 """Servicio de caché con Redis."""
+import gzip
 import json
 from typing import Optional
 from redis.asyncio import Redis
+from app.config import settings
 
 DEFAULT_TTL = 300  # 5 minutos
 
@@ -28,3 +30,38 @@ async def delete_pattern(redis: Redis, pattern: str):
     keys = await redis.keys(pattern)
     if keys:
         await redis.delete(*keys)
+
+
+async def get_cache_comprimido(redis: Redis, key: str) -> Optional[bytes]:
+    """
+    Obtener un contenido guardado ya comprimido con gzip.
+    Requiere el cliente binario (get_redis_binario).
+    """
+    return await redis.get(key)
+
+
+async def set_cache_comprimido(
+    redis: Redis,
+    key: str,
+    contenido: bytes,
+    ttl: int = DEFAULT_TTL
+) -> bytes:
+    """
+    Comprimir una sola vez y guardar en el caché.
+    Devuelve el contenido comprimido para responder con él.
+    """
+    comprimido = gzip.compress(
+        contenido, compresslevel=settings.compresion_nivel)
+    await redis.setex(key, ttl, comprimido)
+    return comprimido
+
+
+async def invalidar_cache_campeonato(redis: Redis, campeonato_id: int):
+    """Eliminar del caché los agregados de un campeonato."""
+    for prefijo in (
+        "posiciones",
+        "estadisticas_jugadores",
+        "estadisticas_equipos"
+    ):
+        await delete_pattern(
+            redis, f"{prefijo}:campeonato:{campeonato_id}*")
@@ -0,0 +1,163 @@
+"""Paginación por cursor (keyset) para listados."""
+import base64
+import json
+from typing import Any, List, Sequence
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import BigInteger, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# exact: COUNT(*) con los mismos filtros; estimate: filas estimadas por el
+# planificador de PostgreSQL (sin recorrer la tabla); none: sin total
+MODOS_CONTEO = ["exact", "estimate", "none"]
+
+
+def codificar_cursor(valores: Sequence[Any]) -> str:
+    """Codifica los valores de la última fila en un cursor opaco."""
+    data = json.dumps(list(valores), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def _tipo_columna(columna) -> type | None:
+    """Tipo de Python de una columna, o None si no se conoce."""
+    try:
+        return columna.type.python_type
+    except (AttributeError, NotImplementedError):
+        return None
+
+
+def _valor_valido(valor: Any, columna) -> bool:
+    """Indica si un valor del cursor puede compararse con la columna."""
+    if isinstance(valor, bool):
+        return False
+    tipo = _tipo_columna(columna)
+    if tipo is int:
+        limite = 2 ** 63 if isinstance(columna.type, BigInteger) else 2 ** 31
+        return isinstance(valor, int) and -limite <= valor < limite
+    if tipo is float:
+        return isinstance(valor, (int, float))
+    if tipo is str:
+        return isinstance(valor, str)
+    return isinstance(valor, (int, float, str))
+
+
+def decodificar_cursor(cursor: str, columnas: Sequence) -> List[Any]:
+    """
+    Decodifica un cursor y valida que tenga un valor del tipo de cada
+    columna; un cursor alterado es un 400, no un error de la base.
+    """
+    invalido = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Cursor inválido"
+    )
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        valores = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+    except (ValueError, TypeError) as e:
+        raise invalido from e
+    if (
+        not isinstance(valores, list)
+        or len(valores) != len(columnas)
+        or not all(map(_valor_valido, valores, columnas))
+    ):
+        raise invalido
+    return valores
+
+
+def paginar_keyset(
+    query,
+    columnas: Sequence,
+    cursor: str | None,
+    limit: int,
+    descendente: bool = False
+):
+    """
+    Ordena la consulta por las columnas indicadas (la última debe ser única)
+    y devuelve limit + 1 filas a partir del cursor, para saber si hay más.
+    """
+    if cursor:
+        valores = decodificar_cursor(cursor, columnas)
+        clave = tuple_(*columnas)
+        query = query.where(
+            clave < tuple_(*valores) if descendente
+            else clave > tuple_(*valores)
+        )
+    orden = [c.desc() for c in columnas] if descendente else list(columnas)
+    return query.order_by(*orden).limit(limit + 1)
+
+
+def siguiente_cursor(filas: list, limit: int, clave) -> str | None:
+    """
+    Recorta la fila extra pedida por paginar_keyset y devuelve el cursor de
+    la siguiente página, o None si no hay más.
+    """
+    if len(filas) <= limit:
+        return None
+    del filas[limit:]
+    return codificar_cursor(clave(filas[-1]))
+
+
+def agregar_enlace_siguiente(
+    request: Request,
+    response: Response,
+    cursor: str | None
+) -> None:
+    """Publica el cursor de la siguiente página en Link y X-Next-Cursor."""
+    if not cursor:
+        return
+    url = request.url.remove_query_params("skip").include_query_params(
+        cursor=cursor)
+    response.headers["Link"] = f'<{url}>; rel="next"'
+    response.headers["X-Next-Cursor"] = cursor
+
+
+def paginar_resultado(
+    request: Request,
+    response: Response,
+    filas: list,
+    limit: int,
+    clave
+) -> list:
+    """Recorta la página y agrega los encabezados de la siguiente."""
+    agregar_enlace_siguiente(
+        request, response, siguiente_cursor(filas, limit, clave))
+    return filas
+
+
+async def contar_total(
+    db: AsyncSession,
+    response: Response,
+    query,
+    modo: str = "none"
+) -> None:
+    """
+    Publica el total de filas de un listado en X-Total-Count según el modo.
+    Debe llamarse con la consulta filtrada, antes de paginarla.
+    """
+    if modo not in MODOS_CONTEO:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"count inválido. Debe ser uno de: {MODOS_CONTEO}"
+        )
+    if modo == "none":
+        return
+
+    base = query.order_by(None).limit(None).offset(None)
+    if modo == "exact":
+        total = (await db.execute(
+            select(func.count()).select_from(base.subquery())
+        )).scalar_one()
+    else:
+        sql = base.compile(
+            dialect=db.bind.dialect,
+            compile_kwargs={"literal_binds": True}
+        )
+        plan = (await db.execute(
+            text(f"EXPLAIN (FORMAT JSON) {sql}")
+        )).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        total = int(plan[0]["Plan"]["Plan Rows"])
+
+    response.headers["X-Total-Count"] = str(total)
+    response.headers["X-Total-Count-Type"] = modo
@@ -7,6 +7,8 @@ from app.config import settings
 class RedisClient:
     """Singleton Redis client manager."""
     _instance: Redis = None
+    # Sin decode_responses, para valores binarios (caché comprimido)
+    _binario: Redis = None
 
     @classmethod
     async def get_instance(cls) -> Redis:
@@ -21,12 +23,26 @@ class RedisClient:
             await cls._instance.ping()
         return cls._instance
 
+    @classmethod
+    async def get_binario(cls) -> Redis:
+        """Get or create the Redis instance that returns raw bytes."""
+        if cls._binario is None:
+            cls._binario = Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=0
+            )
+        return cls._binario
+
     @classmethod
     async def close(cls) -> None:
-        """Close Redis connection."""
+        """Close Redis connections."""
         if cls._instance:
             await cls._instance.aclose()
             cls._instance = None
+        if cls._binario:
+            await cls._binario.aclose()
+            cls._binario = None
 
 
 async def get_redis() -> Redis:
@@ -34,6 +50,11 @@ async def get_redis() -> Redis:
     return await RedisClient.get_instance()
 
 
+async def get_redis_binario() -> Redis:
+    """Obtener cliente Redis que devuelve bytes sin decodificar."""
+    return await RedisClient.get_binario()
+
+
 async def init_redis():
     """Inicializar conexión a Redis."""
     await RedisClient.get_instance()
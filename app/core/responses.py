@@ -0,0 +1,187 @@
+"""Respuestas JSON rápidas: serialización directa con pydantic y gzip."""
+import gzip
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Tuple,
+    Type
+)
+
+from fastapi import HTTPException, Request, Response, status
+from pydantic import BaseModel, TypeAdapter, create_model
+from redis.exceptions import RedisError
+
+from app.core.cache import get_cache_comprimido, set_cache_comprimido
+from app.core.redis import get_redis_binario
+
+# Separador de las columnas etiquetadas que van anidadas en la respuesta
+SEPARADOR = "__"
+
+
+def respuesta_json(
+    contenido: bytes,
+    base: Response | None = None,
+    status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    Envuelve JSON ya serializado en una respuesta, conservando los
+    encabezados agregados al Response inyectado (paginación, totales).
+    """
+    headers = None
+    if base is not None:
+        headers = {
+            clave: valor for clave, valor in base.headers.items()
+            if clave != "content-length"
+        }
+    return Response(
+        content=contenido,
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers
+    )
+
+
+@lru_cache(maxsize=256)
+def adaptador_lista(modelo: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter reutilizable para serializar listas de un modelo."""
+    return TypeAdapter(List[modelo])
+
+
+@lru_cache(maxsize=256)
+def modelo_parcial(
+    modelo: Type[BaseModel],
+    campos: Tuple[str, ...]
+) -> Type[BaseModel]:
+    """Proyección de un esquema con solo los campos indicados."""
+    return create_model(
+        f"{modelo.__name__}Parcial",
+        **{
+            campo: (modelo.model_fields[campo].annotation, ...)
+            for campo in campos
+        }
+    )
+
+
+def parsear_campos(
+    fields: str,
+    modelo: Type[BaseModel]
+) -> Tuple[str, ...]:
+    """Valida el parámetro fields= contra los campos de un esquema."""
+    campos = tuple(dict.fromkeys(
+        c.strip() for c in fields.split(",") if c.strip()
+    ))
+    invalidos = [c for c in campos if c not in modelo.model_fields]
+    if not campos or invalidos:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Campos inválidos. Deben ser de: "
+                   f"{list(modelo.model_fields)}"
+        )
+    return campos
+
+
+def anidar(fila: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Convierte columnas "relacion__campo" en diccionarios anidados.
+    Una relación de un OUTER JOIN sin coincidencia queda en None.
+    """
+    resultado: Dict[str, Any] = {}
+    relaciones = set()
+    for clave, valor in fila.items():
+        if SEPARADOR in clave:
+            relacion, campo = clave.split(SEPARADOR, 1)
+            resultado.setdefault(relacion, {})[campo] = valor
+            relaciones.add(relacion)
+        else:
+            resultado[clave] = valor
+    for relacion in relaciones:
+        if all(v is None for v in resultado[relacion].values()):
+            resultado[relacion] = None
+    return resultado
+
+
+def serializar_lista(
+    modelo: Type[BaseModel],
+    filas: Iterable[Any]
+) -> bytes:
+    """
+    Valida y serializa filas (dicts u objetos ORM) a JSON en una sola pasada
+    de pydantic-core, sin pasar por diccionarios intermedios.
+    """
+    adaptador = adaptador_lista(modelo)
+    return adaptador.dump_json(
+        adaptador.validate_python(list(filas), from_attributes=True))
+
+
+def acepta_gzip(request: Request) -> bool:
+    """
+    Indica si el cliente acepta respuestas comprimidas con gzip, según
+    los valores q de Accept-Encoding (gzip;q=0 la rechaza).
+    """
+    calidades: Dict[str, float] = {}
+    encabezado = request.headers.get("accept-encoding", "")
+    for parte in encabezado.lower().replace(" ", "").split(","):
+        codificacion, _, parametros = parte.partition(";")
+        calidad = 1.0
+        if parametros.startswith("q="):
+            try:
+                calidad = float(parametros[2:])
+            except ValueError:
+                calidad = 0.0
+        calidades[codificacion] = calidad
+    return calidades.get("gzip", calidades.get("*", 0.0)) > 0
+
+
+def respuesta_gzip(
+    request: Request,
+    comprimido: bytes,
+    base: Response | None = None
+) -> Response:
+    """
+    Responde con JSON ya comprimido. El middleware GZip no vuelve a
+    comprimir porque la respuesta trae Content-Encoding; solo se
+    descomprime para los clientes que no aceptan gzip.
+    """
+    if acepta_gzip(request):
+        respuesta = respuesta_json(comprimido, base=base)
+        respuesta.headers["Content-Encoding"] = "gzip"
+    else:
+        respuesta = respuesta_json(gzip.decompress(comprimido), base=base)
+    # Ambas variantes dependen del encabezado, también para cachés
+    # compartidos
+    respuesta.headers["Vary"] = "Accept-Encoding"
+    return respuesta
+
+
+async def respuesta_cacheada(
+    request: Request,
+    clave: str,
+    generar: Callable[[], Awaitable[bytes]]
+) -> Response:
+    """
+    Sirve un listado desde el caché comprimido; si no está, lo genera,
+    lo comprime una vez y lo guarda para los siguientes pedidos. Si Redis
+    falla, responde sin caché en lugar de devolver un error.
+    """
+    try:
+        redis = await get_redis_binario()
+        comprimido = await get_cache_comprimido(redis, clave)
+    except RedisError:
+        redis, comprimido = None, None
+    if comprimido is not None:
+        return respuesta_gzip(request, comprimido)
+
+    contenido = await generar()
+    if redis is not None:
+        try:
+            comprimido = await set_cache_comprimido(redis, clave, contenido)
+            return respuesta_gzip(request, comprimido)
+        except RedisError:
+            pass
+    return respuesta_json(contenido)
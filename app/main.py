@@ -8,12 +8,17 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from app.core.redis import init_redis, close_redis
+from app.services.en_vivo_service import difusor
 from sqlalchemy import text
 
+from app.config import settings
 from app.database import Base, engine, get_db
+from app.models.estadistica_jugador import CONTADORES
 # importar modelos para crear tablas
 from app.routers import (
     usuarios,
@@ -32,13 +37,37 @@ from app.routers import (
 )
 
 
+async def _completar_contadores(conn) -> None:
+    """
+    create_all no modifica tablas existentes: pasa a 0 los contadores
+    nulos de estadísticas anteriores y los deja NOT NULL con default 0.
+    """
+    await conn.execute(text(
+        "UPDATE estadisticas_jugadores SET "
+        + ", ".join(f"{c} = COALESCE({c}, 0)" for c in CONTADORES)
+        + " WHERE "
+        + " OR ".join(f"{c} IS NULL" for c in CONTADORES)
+    ))
+    await conn.execute(text(
+        "ALTER TABLE estadisticas_jugadores "
+        + ", ".join(
+            f"ALTER COLUMN {c} SET DEFAULT 0, ALTER COLUMN {c} SET NOT NULL"
+            for c in CONTADORES
+        )
+    ))
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     """Código que se ejecuta al iniciar"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await _completar_contadores(conn)
     await init_redis()
+    # La suscripción en vivo queda lista antes de la primera conexión
+    difusor.iniciar()
     yield
+    await difusor.cerrar()
     await close_redis()
     await engine.dispose()
 
@@ -47,7 +76,8 @@ app = FastAPI(
     title="LDPSA App API",
     description="API para aplicación LDPSA",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -98,4 +128,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "Link",
+        "X-Next-Cursor",
+        "X-Total-Count",
+        "X-Total-Count-Type"
+    ],
+)
+
+# Comprimir respuestas grandes; las que ya vienen comprimidas del caché
+# (Content-Encoding: gzip) pasan sin volver a comprimirse
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.compresion_tamano_minimo,
+    compresslevel=settings.compresion_nivel
 )
@@ -10,8 +10,10 @@ from app.models.partido import Partido
 from app.models.acta_partido import ActaPartido
 from app.models.evento_partido import EventoPartido
 from app.models.posicion import Posicion
+from app.models.posicion_jornada import PosicionJornada
 from app.models.estadistica_jugador import EstadisticaJugador
-from app.models.estadistica_equipo import EstadisticaEquipo
+from app.models.elegibilidad_jugador import ElegibilidadJugador
+from app.models.linea_tiempo_partido import LineaTiempoPartido
 
 __all__ = [
     "Base",
@@ -24,7 +26,9 @@ __all__ = [
     "Partido",
     "ActaPartido",
     "EventoPartido",
-    "EstadisticaEquipo",
     "EstadisticaJugador",
-    "Posicion"
+    "ElegibilidadJugador",
+    "LineaTiempoPartido",
+    "Posicion",
+    "PosicionJornada"
 ]
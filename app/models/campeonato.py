@@ -4,6 +4,17 @@ from sqlalchemy import Column, Integer, String, DateTime
 from sqlalchemy.orm import relationship
 from app.database import Base
 
+# Criterios aplicados, en orden, a equipos empatados en puntos
+CRITERIOS_DESEMPATE_VALIDOS = [
+    "diferencia_goles",
+    "goles_favor",
+    "ganados",
+    "enfrentamiento_directo"
+]
+CRITERIOS_DESEMPATE_DEFECTO = (
+    "diferencia_goles,goles_favor,enfrentamiento_directo"
+)
+
 
 class Campeonato(Base):
     """Modelo de Campeonatos"""
@@ -18,6 +29,8 @@ class Campeonato(Base):
     canton = Column(String, nullable=True)
     parroquia = Column(String, nullable=True)
     estado = Column(String, default="activo")
+    criterios_desempate = Column(
+        String, default=CRITERIOS_DESEMPATE_DEFECTO, nullable=True)
     created_at = Column(DateTime(timezone=True),
                         default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True),
@@ -30,5 +43,3 @@ class Campeonato(Base):
     posiciones = relationship("Posicion", back_populates="campeonato")
     estadisticas_jugadores = relationship(
         "EstadisticaJugador", back_populates="campeonato")
-    estadisticas_equipos = relationship(
-        "EstadisticaEquipo", back_populates="campeonato")
@@ -0,0 +1,49 @@
+"""Modelo de ElegibilidadJugador."""
+from datetime import datetime, timezone
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint
+)
+from sqlalchemy.orm import relationship
+from app.database import Base
+
+
+class ElegibilidadJugador(Base):
+    """
+    Índice de suspensiones por jugador y campeonato, una fila por partido
+    que las originó. El jugador no puede ser convocado entre jornada_desde
+    y jornada_hasta.
+    """
+    __tablename__ = "elegibilidad_jugadores"
+    __table_args__ = (
+        UniqueConstraint(
+            "jugador_id", "partido_id",
+            name="uq_elegibilidad_jugador_partido"),
+        Index("ix_elegibilidad_jugador_campeonato",
+              "jugador_id", "campeonato_id"),
+        Index("ix_elegibilidad_campeonato_jornada_hasta",
+              "campeonato_id", "jornada_hasta"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    jugador_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
+    campeonato_id = Column(Integer, ForeignKey(
+        "campeonatos.id"), nullable=False)
+    # Partido en el que se originó la sanción
+    partido_id = Column(Integer, ForeignKey("partidos.id"), nullable=False)
+    jornada_desde = Column(Integer, nullable=False)
+    jornada_hasta = Column(Integer, nullable=False)
+    motivo = Column(String, nullable=True)  # TarjetaRoja, Amarillas
+    created_at = Column(DateTime(timezone=True),
+                        default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime(timezone=True),
+                        default=lambda: datetime.now(timezone.utc),
+                        onupdate=lambda: datetime.now(timezone.utc))
+
+    # Relaciones
+    jugador = relationship("Usuario")
@@ -38,4 +38,3 @@ class Equipo(Base):
     actas = relationship("ActaPartido", back_populates="equipo")
     eventos = relationship("EventoPartido", back_populates="equipo")
     posicion = relationship("Posicion", back_populates="equipo")
-    estadisticas = relationship("EstadisticaEquipo", back_populates="equipo")
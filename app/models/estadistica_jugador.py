@@ -5,24 +5,59 @@ from sqlalchemy import (
     Integer,
     DateTime,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from app.database import Base
 
+# Contadores acumulados; nunca nulos para que los índices de líderes
+# sirvan para ordenar y paginar sin COALESCE
+CONTADORES = (
+    "goles",
+    "asistencias",
+    "tarjetas_amarillas",
+    "tarjetas_rojas",
+    "partidos_jugados",
+    "minutos_jugados",
+    "suspensiones"
+)
+
 
 class EstadisticaJugador(Base):
     """Estadísticas de un jugador por campeonato."""
     __tablename__ = "estadisticas_jugadores"
+    # Un índice por tabla de líderes: (campeonato, métrica, id)
+    __table_args__ = tuple(
+        Index(f"ix_estadisticas_jugadores_campeonato_{metrica}",
+              "campeonato_id", metrica, "id")
+        for metrica in (
+            "goles",
+            "asistencias",
+            "tarjetas_amarillas",
+            "tarjetas_rojas",
+            "partidos_jugados"
+        )
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     jugador_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
     campeonato_id = Column(Integer, ForeignKey(
         "campeonatos.id"), nullable=False)
-    goles = Column(Integer, default=0)
-    asistencias = Column(Integer, default=0)
-    tarjetas_amarillas = Column(Integer, default=0)
-    tarjetas_rojas = Column(Integer, default=0)
-    partidos_jugados = Column(Integer, default=0)
+    goles = Column(
+        Integer, default=0, server_default="0", nullable=False)
+    asistencias = Column(
+        Integer, default=0, server_default="0", nullable=False)
+    tarjetas_amarillas = Column(
+        Integer, default=0, server_default="0", nullable=False)
+    tarjetas_rojas = Column(
+        Integer, default=0, server_default="0", nullable=False)
+    partidos_jugados = Column(
+        Integer, default=0, server_default="0", nullable=False)
+    minutos_jugados = Column(
+        Integer, default=0, server_default="0", nullable=False)
+    # Rojas + una por cada bloque de amarillas acumuladas
+    suspensiones = Column(
+        Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime(timezone=True),
                         default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True),
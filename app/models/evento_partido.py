@@ -5,25 +5,51 @@ from sqlalchemy import (
     Integer,
     DateTime,
     ForeignKey,
-    String
+    String,
+    UniqueConstraint
 )
 from sqlalchemy.orm import relationship
 from app.database import Base
 
+# Tipos de evento que cambian el marcador
+TIPOS_GOL = ("Gol", "Autogol")
+
+
+def equipo_del_gol(partido, tipo: str, equipo_id: int) -> int:
+    """
+    Equipo al que suma un gol. En un autogol, equipo_id es el del jugador
+    que lo marcó y el gol cuenta para el rival.
+    """
+    if tipo != "Autogol":
+        return equipo_id
+    if equipo_id == partido.equipo_local_id:
+        return partido.equipo_visitante_id
+    return partido.equipo_local_id
+
 
 class EventoPartido(Base):
     """Goles, tarjetas y cambios de un partido."""
     __tablename__ = "eventos_partido"
+    __table_args__ = (
+        # Reintentos de un lote no duplican eventos (ver /batch)
+        UniqueConstraint(
+            "partido_id", "id_cliente",
+            name="uq_eventos_partido_partido_cliente"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     partido_id = Column(Integer, ForeignKey("partidos.id"), nullable=False)
     jugador_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
     equipo_id = Column(Integer, ForeignKey("equipos.id"), nullable=False)
-    # Gol, TarjetaAmarilla, TarjetaRoja, Cambio
+    # Gol, Autogol, TarjetaAmarilla, TarjetaRoja, Cambio
     tipo = Column(String, nullable=False)
     minuto = Column(Integer, nullable=True)
     jugador_sale_id = Column(Integer, ForeignKey(
         "usuarios.id"), nullable=True)  # Solo para cambios
+    asistente_id = Column(Integer, ForeignKey(
+        "usuarios.id"), nullable=True)  # Solo para goles
+    # Id generado por el dispositivo del vocal, para ingesta idempotente
+    id_cliente = Column(String(64), nullable=True)
     created_at = Column(DateTime(timezone=True),
                         default=lambda: datetime.now(timezone.utc))
 
@@ -34,4 +60,5 @@ class EventoPartido(Base):
         "Usuario", foreign_keys=[
             jugador_id], back_populates="eventos")
     jugador_sale = relationship("Usuario", foreign_keys=[jugador_sale_id])
+    asistente = relationship("Usuario", foreign_keys=[asistente_id])
     equipo = relationship("Equipo", back_populates="eventos")
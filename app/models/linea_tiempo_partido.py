@@ -0,0 +1,19 @@
+"""Modelo de LineaTiempoPartido."""
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+from app.database import Base
+
+
+class LineaTiempoPartido(Base):
+    """
+    Línea de tiempo de un partido finalizado, calculada una sola vez:
+    eventos ordenados con el marcador parcial y los jugadores en cancha.
+    Se elimina al reabrir el partido.
+    """
+    __tablename__ = "lineas_tiempo_partido"
+
+    partido_id = Column(Integer, ForeignKey("partidos.id"), primary_key=True)
+    contenido = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True),
+                        default=lambda: datetime.now(timezone.utc))
@@ -2,18 +2,33 @@
 from datetime import datetime, timezone
 from sqlalchemy import (
     Column,
+    Computed,
+    Index,
     Integer,
     DateTime,
     ForeignKey,
-    String
+    String,
+    UniqueConstraint
 )
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
 class Posicion(Base):
-    """Tabla de posiciones por campeonato."""
+    """
+    Agregado único de un equipo por campeonato.
+    Alimenta la tabla de posiciones y las estadísticas de equipos.
+    """
     __tablename__ = "posiciones"
+    __table_args__ = (
+        UniqueConstraint(
+            "campeonato_id", "equipo_id", name="uq_posicion_campeonato_equipo"),
+        # Coincide con el orden de la tabla de posiciones
+        Index("ix_posiciones_campeonato_serie_puesto",
+              "campeonato_id", "serie", "puesto"),
+    )
+    # Trae en el mismo flush la columna generada diferencia_goles
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     campeonato_id = Column(Integer, ForeignKey(
@@ -27,6 +42,23 @@ class Posicion(Base):
     goles_favor = Column(Integer, default=0)
     goles_contra = Column(Integer, default=0)
     puntos = Column(Integer, default=0)
+    diferencia_goles = Column(
+        Integer, Computed("goles_favor - goles_contra", persisted=True))
+    # Se recalcula una vez por partido finalizado o reabierto
+    puesto = Column(Integer, nullable=True)
+    # Desglose como local y como visitante
+    ganados_local = Column(Integer, default=0)
+    empatados_local = Column(Integer, default=0)
+    perdidos_local = Column(Integer, default=0)
+    goles_favor_local = Column(Integer, default=0)
+    goles_contra_local = Column(Integer, default=0)
+    ganados_visitante = Column(Integer, default=0)
+    empatados_visitante = Column(Integer, default=0)
+    perdidos_visitante = Column(Integer, default=0)
+    goles_favor_visitante = Column(Integer, default=0)
+    goles_contra_visitante = Column(Integer, default=0)
+    # Últimos resultados (G/E/P), el más reciente al final
+    forma = Column(String, default="")
     created_at = Column(DateTime(timezone=True),
                         default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True),
@@ -36,3 +68,27 @@ class Posicion(Base):
     # Relaciones
     campeonato = relationship("Campeonato", back_populates="posiciones")
     equipo = relationship("Equipo", back_populates="posicion")
+
+    def _sede(self, sede: str) -> dict:
+        """Estadísticas del equipo como local o como visitante."""
+        ganados = getattr(self, f"ganados_{sede}") or 0
+        empatados = getattr(self, f"empatados_{sede}") or 0
+        perdidos = getattr(self, f"perdidos_{sede}") or 0
+        return {
+            "partidos_jugados": ganados + empatados + perdidos,
+            "victorias": ganados,
+            "empates": empatados,
+            "derrotas": perdidos,
+            "goles_favor": getattr(self, f"goles_favor_{sede}") or 0,
+            "goles_contra": getattr(self, f"goles_contra_{sede}") or 0,
+        }
+
+    @property
+    def estadistica_local(self) -> dict:
+        """Estadísticas del equipo jugando como local."""
+        return self._sede("local")
+
+    @property
+    def estadistica_visitante(self) -> dict:
+        """Estadísticas del equipo jugando como visitante."""
+        return self._sede("visitante")
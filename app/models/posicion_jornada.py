@@ -0,0 +1,52 @@
+"""Modelo de PosicionJornada."""
+from datetime import datetime, timezone
+from sqlalchemy import (
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint
+)
+from sqlalchemy.orm import relationship
+from app.database import Base
+
+
+class PosicionJornada(Base):
+    """Tabla de posiciones acumulada de un campeonato tras cada jornada."""
+    __tablename__ = "posiciones_jornada"
+    __table_args__ = (
+        UniqueConstraint(
+            "campeonato_id", "jornada", "equipo_id",
+            name="uq_posicion_jornada_campeonato_jornada_equipo"),
+        Index("ix_posiciones_jornada_campeonato_jornada_serie_puesto",
+              "campeonato_id", "jornada", "serie", "puesto"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    campeonato_id = Column(Integer, ForeignKey(
+        "campeonatos.id"), nullable=False)
+    jornada = Column(Integer, nullable=False)
+    equipo_id = Column(Integer, ForeignKey("equipos.id"), nullable=False)
+    serie = Column(String, nullable=True)
+    partidos_jugados = Column(Integer, default=0)
+    ganados = Column(Integer, default=0)
+    empatados = Column(Integer, default=0)
+    perdidos = Column(Integer, default=0)
+    goles_favor = Column(Integer, default=0)
+    goles_contra = Column(Integer, default=0)
+    puntos = Column(Integer, default=0)
+    diferencia_goles = Column(
+        Integer, Computed("goles_favor - goles_contra", persisted=True))
+    puesto = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True),
+                        default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime(timezone=True),
+                        default=lambda: datetime.now(timezone.utc),
+                        onupdate=lambda: datetime.now(timezone.utc))
+
+    # Relaciones
+    equipo = relationship("Equipo")
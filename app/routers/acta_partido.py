@@ -1,7 +1,17 @@
 """Router de Acta de Partido."""
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import (
+    Integer,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true
+)
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,13 +21,26 @@ from app.models.partido import Partido
 from app.models.usuario import Usuario
 from app.models.equipo import Equipo
 from app.models.jugador_equipo import JugadorEquipo
+from app.models.elegibilidad_jugador import ElegibilidadJugador
 from app.schemas.acta_partido import (
+    ActaPartidoCopiar,
     ActaPartidoCreate,
+    ActaPartidoLoteCreate,
     ActaPartidoUpdate,
     ActaPartidoResponse,
-    ActaPartidoDetalleResponse
+    ActaPartidoDetalleResponse,
+    JugadorInhabilitadoResponse
 )
 from app.core.dependencies import require_authenticated, require_admin
+from app.services.contexto_partido_service import (
+    invalidar_contexto,
+    obtener_contexto
+)
+from app.services.elegibilidad_service import (
+    jugador_suspendido,
+    jugadores_suspendidos,
+    sancion_vigente
+)
 
 router = APIRouter(prefix="/acta-partido", tags=["Acta de Partido"])
 
@@ -33,10 +56,8 @@ async def agregar_jugador_acta(
     db: AsyncSession = Depends(get_db)
 ):
     """Agregar un jugador al acta de un partido."""
-    # Verificar que el partido existe
-    partido = (await db.execute(
-        select(Partido).where(Partido.id == datos.partido_id)
-    )).scalar_one_or_none()
+    # Verificar que el partido existe (contexto en caché)
+    partido = await obtener_contexto(db, datos.partido_id)
     if not partido:
         raise HTTPException(status_code=404, detail="Partido no encontrado")
 
@@ -55,8 +76,7 @@ async def agregar_jugador_acta(
         raise HTTPException(status_code=404, detail="Jugador no encontrado")
 
     # Verificar que el equipo existe y es parte del partido
-    if datos.equipo_id not in [
-            partido.equipo_local_id, partido.equipo_visitante_id]:
+    if datos.equipo_id not in partido.equipos:
         raise HTTPException(
             status_code=400,
             detail="El equipo no es parte de este partido"
@@ -91,13 +111,226 @@ async def agregar_jugador_acta(
             detail="El jugador ya está en el acta de este partido"
         )
 
+    # Verificar que el jugador no esté suspendido para esta jornada
+    if await jugador_suspendido(
+            db, datos.jugador_id, partido.campeonato_id, partido.jornada):
+        raise HTTPException(
+            status_code=400,
+            detail="El jugador está suspendido para esta jornada"
+        )
+
     db_acta = ActaPartido(**datos.model_dump())
     db.add(db_acta)
     await db.commit()
+    await invalidar_contexto(partido.id)
     await db.refresh(db_acta)
     return db_acta
 
 
+@router.post(
+    "/lote",
+    response_model=List[ActaPartidoResponse],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_admin)]
+)
+async def agregar_convocatoria(
+    datos: ActaPartidoLoteCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Cargar la convocatoria completa de un equipo en una sola petición.
+    Pertenencia, duplicados y suspensiones se validan con una consulta
+    por conjunto y el acta se inserta en una sola sentencia.
+    """
+    partido = await obtener_contexto(db, datos.partido_id)
+    if not partido:
+        raise HTTPException(status_code=404, detail="Partido no encontrado")
+
+    # No se puede modificar el acta de un partido finalizado
+    if partido.estado == "Finalizado":
+        raise HTTPException(
+            status_code=400,
+            detail="No se puede modificar el acta de un partido finalizado"
+        )
+
+    # Verificar que el equipo es parte del partido
+    if datos.equipo_id not in partido.equipos:
+        raise HTTPException(
+            status_code=400,
+            detail="El equipo no es parte de este partido"
+        )
+
+    ids = [j.jugador_id for j in datos.jugadores]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(
+            status_code=400,
+            detail="Hay jugadores repetidos en la convocatoria"
+        )
+
+    # Jugadores que pertenecen al equipo en ese campeonato
+    miembros = set((await db.execute(
+        select(JugadorEquipo.usuario_id)
+        .join(Equipo, JugadorEquipo.equipo_id == Equipo.id)
+        .where(
+            JugadorEquipo.usuario_id.in_(ids),
+            JugadorEquipo.equipo_id == datos.equipo_id,
+            Equipo.campeonato_id == partido.campeonato_id
+        )
+    )).scalars())
+    ajenos = [i for i in ids if i not in miembros]
+    if ajenos:
+        raise HTTPException(
+            status_code=400,
+            detail="Jugadores que no pertenecen a este equipo en el "
+                   f"campeonato: {ajenos}"
+        )
+
+    # Jugadores que ya están en el acta de este partido
+    existentes = set((await db.execute(
+        select(ActaPartido.jugador_id).where(
+            ActaPartido.partido_id == datos.partido_id,
+            ActaPartido.jugador_id.in_(ids)
+        )
+    )).scalars())
+    if existentes:
+        raise HTTPException(
+            status_code=400,
+            detail="Jugadores que ya están en el acta de este partido: "
+                   f"{sorted(existentes)}"
+        )
+
+    suspendidos = await jugadores_suspendidos(
+        db, ids, partido.campeonato_id, partido.jornada)
+    if suspendidos:
+        raise HTTPException(
+            status_code=400,
+            detail="Jugadores suspendidos para esta jornada: "
+                   f"{sorted(suspendidos)}"
+        )
+
+    actas = list(await db.scalars(
+        insert(ActaPartido).returning(ActaPartido),
+        [
+            {
+                "partido_id": datos.partido_id,
+                "jugador_id": j.jugador_id,
+                "equipo_id": datos.equipo_id,
+                "convocado": True,
+                "titular": bool(j.titular)
+            }
+            for j in datos.jugadores
+        ]
+    ))
+    await db.commit()
+    await invalidar_contexto(partido.id)
+    return actas
+
+
+@router.post(
+    "/copiar",
+    response_model=List[ActaPartidoResponse],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_admin)]
+)
+async def copiar_acta_anterior(
+    datos: ActaPartidoCopiar,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Copiar el acta de un equipo desde su último partido finalizado con un
+    solo INSERT ... SELECT. Se omiten en SQL los jugadores que ya no están
+    en el equipo, los suspendidos para la jornada y los que ya figuran en
+    el acta del partido.
+    """
+    partido = await obtener_contexto(db, datos.partido_id)
+    if not partido:
+        raise HTTPException(status_code=404, detail="Partido no encontrado")
+
+    # No se puede modificar el acta de un partido finalizado
+    if partido.estado == "Finalizado":
+        raise HTTPException(
+            status_code=400,
+            detail="No se puede modificar el acta de un partido finalizado"
+        )
+
+    # Verificar que el equipo es parte del partido
+    if datos.equipo_id not in partido.equipos:
+        raise HTTPException(
+            status_code=400,
+            detail="El equipo no es parte de este partido"
+        )
+
+    anterior_id = (await db.execute(
+        select(Partido.id)
+        .where(
+            Partido.id != partido.id,
+            Partido.campeonato_id == partido.campeonato_id,
+            Partido.jornada < partido.jornada,
+            Partido.estado == "Finalizado",
+            or_(
+                Partido.equipo_local_id == datos.equipo_id,
+                Partido.equipo_visitante_id == datos.equipo_id
+            )
+        )
+        .order_by(Partido.jornada.desc(), Partido.id.desc())
+        .limit(1)
+    )).scalar_one_or_none()
+    if anterior_id is None:
+        raise HTTPException(
+            status_code=404,
+            detail="El equipo no tiene un partido finalizado anterior"
+        )
+
+    actual = aliased(ActaPartido)
+    origen = (
+        select(
+            literal(partido.id, Integer),
+            ActaPartido.jugador_id,
+            ActaPartido.equipo_id,
+            true(),
+            ActaPartido.titular,
+            func.now()
+        )
+        # Solo jugadores que siguen en el equipo
+        .join(
+            JugadorEquipo,
+            (JugadorEquipo.usuario_id == ActaPartido.jugador_id)
+            & (JugadorEquipo.equipo_id == ActaPartido.equipo_id)
+        )
+        .where(
+            ActaPartido.partido_id == anterior_id,
+            ActaPartido.equipo_id == datos.equipo_id,
+            ActaPartido.convocado.is_(True),
+            ~exists().where(
+                ElegibilidadJugador.jugador_id == ActaPartido.jugador_id,
+                sancion_vigente(partido.campeonato_id, partido.jornada)
+            ),
+            ~exists().where(
+                actual.partido_id == partido.id,
+                actual.jugador_id == ActaPartido.jugador_id
+            )
+        )
+    )
+    actas = list(await db.scalars(
+        insert(ActaPartido)
+        .from_select(
+            [
+                "partido_id",
+                "jugador_id",
+                "equipo_id",
+                "convocado",
+                "titular",
+                "created_at"
+            ],
+            origen
+        )
+        .returning(ActaPartido)
+    ))
+    await db.commit()
+    await invalidar_contexto(partido.id)
+    return actas
+
+
 @router.get(
     "/partido/{partido_id}",
     response_model=List[ActaPartidoDetalleResponse],
@@ -125,6 +358,26 @@ async def listar_acta_partido(
     return result.scalars().all()
 
 
+@router.get(
+    "/campeonato/{campeonato_id}/jornada/{jornada}/inhabilitados",
+    response_model=List[JugadorInhabilitadoResponse],
+    dependencies=[Depends(require_authenticated)]
+)
+async def listar_inhabilitados(
+    campeonato_id: int,
+    jornada: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Listar los jugadores suspendidos para una jornada del campeonato."""
+    result = await db.execute(
+        select(ElegibilidadJugador)
+        .options(joinedload(ElegibilidadJugador.jugador))
+        .where(sancion_vigente(campeonato_id, jornada))
+        .order_by(ElegibilidadJugador.jugador_id)
+    )
+    return result.scalars().all()
+
+
 @router.put(
     "/{acta_id}",
     response_model=ActaPartidoResponse,
@@ -144,9 +397,7 @@ async def actualizar_acta(
             status_code=404, detail="Registro de acta no encontrado")
 
     # Verificar que el partido no esté finalizado
-    partido = (await db.execute(
-        select(Partido).where(Partido.id == db_acta.partido_id)
-    )).scalar_one_or_none()
+    partido = await obtener_contexto(db, db_acta.partido_id)
     if partido.estado == "Finalizado":
         raise HTTPException(
             status_code=400,
@@ -158,6 +409,7 @@ async def actualizar_acta(
         setattr(db_acta, field, value)
 
     await db.commit()
+    await invalidar_contexto(partido.id)
     await db.refresh(db_acta)
     return db_acta
 
@@ -180,9 +432,7 @@ async def eliminar_acta(
             status_code=404, detail="Registro de acta no encontrado")
 
     # Verificar que el partido no esté finalizado
-    partido = (await db.execute(
-        select(Partido).where(Partido.id == db_acta.partido_id)
-    )).scalar_one_or_none()
+    partido = await obtener_contexto(db, db_acta.partido_id)
     if partido.estado == "Finalizado":
         raise HTTPException(
             status_code=400,
@@ -191,4 +441,5 @@ async def eliminar_acta(
 
     await db.delete(db_acta)
     await db.commit()
+    await invalidar_contexto(partido.id)
     return None
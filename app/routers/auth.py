@@ -99,32 +99,39 @@ async def login(
     }
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> Usuario:
-    """Obtener usuario actual desde el token."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="No se pudo validar las credenciales",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
+async def usuario_desde_token(
+    db: AsyncSession,
+    token: str
+) -> Usuario | None:
+    """Usuario del token, o None si el token o el usuario no son válidos."""
     # Decodificar token
     payload = decode_access_token(token)
     if payload is None:
-        raise credentials_exception
+        return None
 
     username: str = payload.get("sub")
     user_id: int = payload.get("user_id")
 
     if username is None or user_id is None:
-        raise credentials_exception
+        return None
 
     # Buscar usuario en BD
     result = await db.execute(select(Usuario).where(Usuario.id == user_id))
-    usuario = result.scalar_one_or_none()
+    return result.scalar_one_or_none()
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> Usuario:
+    """Obtener usuario actual desde el token."""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="No se pudo validar las credenciales",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
 
+    usuario = await usuario_desde_token(db, token)
     if usuario is None:
         raise credentials_exception
 
@@ -1,6 +1,7 @@
 """Router de Campeonatos."""
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,10 +16,33 @@ from app.core.dependencies import (
     require_authenticated,
     require_directivo_campeonato
 )
+from app.core.cache import invalidar_cache_campeonato
+from app.core.redis import get_redis
+from app.core.pagination import (
+    contar_total,
+    paginar_keyset,
+    paginar_resultado
+)
+from app.models.campeonato import CRITERIOS_DESEMPATE_VALIDOS
+from app.services.posiciones_service import (
+    criterios_invalidos,
+    recalcular_instantaneas,
+    recalcular_puestos
+)
 
 router = APIRouter(prefix="/campeonatos", tags=["Campeonatos"])
 
 
+def _validar_criterios(criterios: str | None) -> None:
+    """Verifica que los criterios de desempate estén soportados."""
+    if criterios_invalidos(criterios):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Criterios de desempate inválidos. Deben ser de: "
+                   f"{CRITERIOS_DESEMPATE_VALIDOS}"
+        )
+
+
 @router.post(
     "/",
     response_model=CampeonatoResponse,
@@ -40,6 +64,8 @@ async def crear_campeonato(
             detail="Ya existe un campeonato con ese nombre."
         )
 
+    _validar_criterios(campeonato.criterios_desempate)
+
     db_campeonato = Campeonato(**campeonato.model_dump())
     db.add(db_campeonato)
     await db.commit()
@@ -53,8 +79,12 @@ async def crear_campeonato(
     dependencies=[Depends(require_authenticated)]
 )
 async def listar_campeonatos(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = None,
+    count: str = "none",
     estado: str | None = None,
     db: AsyncSession = Depends(get_db)
 ):
@@ -62,9 +92,14 @@ async def listar_campeonatos(
     query = select(Campeonato)
     if estado:
         query = query.where(Campeonato.estado == estado)
-    query = query.offset(skip).limit(limit)
+    await contar_total(db, response, query, count)
+    query = paginar_keyset(query, [Campeonato.id], cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
     result = await db.execute(query)
-    return result.scalars().all()
+    return paginar_resultado(
+        request, response, list(result.scalars().all()), limit,
+        lambda c: (c.id,))
 
 
 @router.get(
@@ -112,10 +147,20 @@ async def actualizar_campeonato(
         )
 
     update_data = campeonato_update.model_dump(exclude_unset=True)
+    if "criterios_desempate" in update_data:
+        _validar_criterios(update_data["criterios_desempate"])
     for field, value in update_data.items():
         setattr(db_campeonato, field, value)
 
+    # Cambiar los criterios reordena la tabla materializada y la de cada
+    # jornada
+    if "criterios_desempate" in update_data:
+        await recalcular_puestos(db, campeonato_id)
+        await recalcular_instantaneas(db, campeonato_id)
+
     await db.commit()
+    # Los listados cacheados incluyen el nombre y el orden de la tabla
+    await invalidar_cache_campeonato(await get_redis(), campeonato_id)
     await db.refresh(db_campeonato)
     return db_campeonato
 
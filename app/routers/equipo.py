@@ -1,6 +1,7 @@
 """Router de Equipos."""
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,6 +11,11 @@ from app.models.campeonato import Campeonato
 from app.schemas.equipo import EquipoCreate, EquipoResponse, EquipoUpdate
 from app.schemas.equipo import PresignedUrlRequest, PresignedUrlResponse
 from app.services.r2 import generar_presigned_url
+from app.core.pagination import (
+    contar_total,
+    paginar_keyset,
+    paginar_resultado
+)
 from app.core.dependencies import (
     require_authenticated,
     require_directivo_campeonato
@@ -87,18 +93,27 @@ async def crear_equipo(
     dependencies=[Depends(require_authenticated)]
 )
 async def listar_equipos(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    count: str = "none",
     campeonato_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
 ):
-    """Listar equipos. Filtro opcional por campeonato."""
+    """Listar equipos. Filtro opcional por campeonato. Paginado por cursor."""
     query = select(Equipo)
     if campeonato_id:
         query = query.where(Equipo.campeonato_id == campeonato_id)
-    query = query.offset(skip).limit(limit)
+    await contar_total(db, response, query, count)
+    query = paginar_keyset(query, [Equipo.id], cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
     result = await db.execute(query)
-    return result.scalars().all()
+    return paginar_resultado(
+        request, response, list(result.scalars().all()), limit,
+        lambda e: (e.id,))
 
 
 @router.get(
@@ -1,17 +1,18 @@
-"""Router de Estadísticas de Equipos."""
+"""Router de Estadísticas de Equipos (proyección de Posicion)."""
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.models.estadistica_equipo import EstadisticaEquipo
+from app.models.posicion import Posicion
 from app.models.campeonato import Campeonato
 from app.schemas.estadisticas_equipo import (
     EstadisticaEquipoDetalleResponse
 )
 from app.core.dependencies import require_authenticated
+from app.core.responses import respuesta_cacheada, serializar_lista
 
 router = APIRouter(
     prefix="/estadisticas-equipos",
@@ -25,26 +26,33 @@ router = APIRouter(
     dependencies=[Depends(require_authenticated)]
 )
 async def listar_estadisticas_campeonato(
+    request: Request,
     campeonato_id: int,
     db: AsyncSession = Depends(get_db)
 ):
     """Listar estadísticas de todos los equipos en un campeonato."""
-    campeonato = (await db.execute(
-        select(Campeonato).where(Campeonato.id == campeonato_id)
-    )).scalar_one_or_none()
-    if not campeonato:
-        raise HTTPException(status_code=404, detail="Campeonato no encontrado")
+    async def generar() -> bytes:
+        campeonato = (await db.execute(
+            select(Campeonato).where(Campeonato.id == campeonato_id)
+        )).scalar_one_or_none()
+        if not campeonato:
+            raise HTTPException(
+                status_code=404, detail="Campeonato no encontrado")
 
-    result = await db.execute(
-        select(EstadisticaEquipo)
-        .options(
-            joinedload(EstadisticaEquipo.equipo),
-            joinedload(EstadisticaEquipo.campeonato)
+        result = await db.execute(
+            select(Posicion)
+            .options(
+                joinedload(Posicion.equipo),
+                joinedload(Posicion.campeonato)
+            )
+            .where(Posicion.campeonato_id == campeonato_id)
+            .order_by(Posicion.puntos.desc())
         )
-        .where(EstadisticaEquipo.campeonato_id == campeonato_id)
-        .order_by(EstadisticaEquipo.puntos.desc())
-    )
-    return result.scalars().all()
+        return serializar_lista(
+            EstadisticaEquipoDetalleResponse, result.scalars().all())
+
+    return await respuesta_cacheada(
+        request, f"estadisticas_equipos:campeonato:{campeonato_id}", generar)
 
 
 @router.get(
@@ -59,13 +67,13 @@ async def obtener_estadistica_equipo(
 ):
     """Obtener estadísticas de un equipo en un campeonato específico."""
     estadistica = (await db.execute(
-        select(EstadisticaEquipo)
+        select(Posicion)
         .options(
-            joinedload(EstadisticaEquipo.equipo),
-            joinedload(EstadisticaEquipo.campeonato)
+            joinedload(Posicion.equipo),
+            joinedload(Posicion.campeonato)
         ).where(
-            EstadisticaEquipo.equipo_id == equipo_id,
-            EstadisticaEquipo.campeonato_id == campeonato_id
+            Posicion.equipo_id == equipo_id,
+            Posicion.campeonato_id == campeonato_id
         )
     )).scalar_one_or_none()
     if not estadistica:
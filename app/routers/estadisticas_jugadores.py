@@ -1,7 +1,7 @@
 """Router de Estadísticas de Jugadores."""
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,39 +10,126 @@ from app.models.equipo import Equipo
 from app.models.estadistica_jugador import EstadisticaJugador
 from app.models.campeonato import Campeonato
 from app.models.jugador_equipo import JugadorEquipo
-from app.schemas.estadisticas_jugador import EstadisticaJugadorDetalleResponse
+from app.models.usuario import Usuario
+from app.schemas.estadisticas_jugador import (
+    CarreraJugadorResponse,
+    EstadisticaJugadorDetalleResponse,
+    LideresResponse
+)
 from app.core.dependencies import require_authenticated
+from app.core.pagination import paginar_keyset, siguiente_cursor
+from app.core.responses import (
+    SEPARADOR,
+    anidar,
+    respuesta_cacheada,
+    serializar_lista
+)
 
 router = APIRouter(
     prefix="/estadisticas-jugadores",
     tags=["Estadísticas Jugadores"])
 
+# Métricas disponibles para las tablas de líderes (cada una con su índice)
+METRICAS_LIDERES = [
+    "goles",
+    "asistencias",
+    "tarjetas_amarillas",
+    "tarjetas_rojas",
+    "partidos_jugados"
+]
 
-async def _get_equipo_jugador(
-    db: AsyncSession,
-    jugador_id: int,
-    campeonato_id: int
-):
-    """Obtiene el equipo de un jugador en un campeonato."""
-    jugador_equipo = (await db.execute(
-        select(JugadorEquipo)
+# Campos que se suman en la carrera de un jugador
+CAMPOS_CARRERA = METRICAS_LIDERES + ["minutos_jugados"]
+
+# Columnas propias de EstadisticaJugador en la respuesta detallada
+CAMPOS_ESTADISTICA = (
+    "id",
+    "goles",
+    "asistencias",
+    "tarjetas_amarillas",
+    "tarjetas_rojas",
+    "partidos_jugados",
+    "created_at",
+    "updated_at"
+)
+
+
+def _equipos_campeonato(campeonato_id: int):
+    """Subconsulta jugador → equipo dentro de un campeonato."""
+    return (
+        select(
+            JugadorEquipo.usuario_id.label("usuario_id"),
+            JugadorEquipo.equipo_id.label("equipo_id")
+        )
         .join(Equipo, JugadorEquipo.equipo_id == Equipo.id)
-        .options(joinedload(JugadorEquipo.equipo))
-        .where(
-            JugadorEquipo.usuario_id == jugador_id,
-            Equipo.campeonato_id == campeonato_id
+        .where(Equipo.campeonato_id == campeonato_id)
+        .subquery()
+    )
+
+
+def _query_estadisticas_con_equipo(campeonato_id: int):
+    """
+    Consulta de estadísticas con el equipo del jugador resuelto en el mismo
+    SELECT, para no lanzar una consulta adicional por jugador.
+    """
+    equipos_campeonato = _equipos_campeonato(campeonato_id)
+    return (
+        select(EstadisticaJugador, Equipo)
+        .outerjoin(
+            equipos_campeonato,
+            equipos_campeonato.c.usuario_id == EstadisticaJugador.jugador_id
         )
-    )).scalar_one_or_none()
-    return jugador_equipo.equipo if jugador_equipo else None
+        .outerjoin(Equipo, Equipo.id == equipos_campeonato.c.equipo_id)
+        .options(
+            joinedload(EstadisticaJugador.jugador),
+            joinedload(EstadisticaJugador.campeonato)
+        )
+        .where(EstadisticaJugador.campeonato_id == campeonato_id)
+    )
 
 
-async def _build_response(
-    db: AsyncSession,
+def _query_estadisticas_columnas(campeonato_id: int):
+    """
+    Misma consulta que _query_estadisticas_con_equipo, pero solo con las
+    columnas de la respuesta ("relacion__campo" para las anidadas), para
+    listados de solo lectura que no necesitan instancias ORM.
+    """
+    equipos_campeonato = _equipos_campeonato(campeonato_id)
+    columnas = [
+        getattr(EstadisticaJugador, campo).label(campo)
+        for campo in CAMPOS_ESTADISTICA
+    ] + [
+        func.coalesce(getattr(EstadisticaJugador, campo), 0).label(campo)
+        for campo in ("minutos_jugados", "suspensiones")
+    ]
+    for relacion, modelo, campos in (
+        ("jugador", Usuario, ("id", "nombres", "apellidos")),
+        ("campeonato", Campeonato, ("id", "nombre")),
+        ("equipo", Equipo, ("id", "nombre", "logo_url")),
+    ):
+        columnas.extend(
+            getattr(modelo, campo).label(f"{relacion}{SEPARADOR}{campo}")
+            for campo in campos
+        )
+    return (
+        select(*columnas)
+        .select_from(EstadisticaJugador)
+        .join(Usuario, Usuario.id == EstadisticaJugador.jugador_id)
+        .join(Campeonato, Campeonato.id == EstadisticaJugador.campeonato_id)
+        .outerjoin(
+            equipos_campeonato,
+            equipos_campeonato.c.usuario_id == EstadisticaJugador.jugador_id
+        )
+        .outerjoin(Equipo, Equipo.id == equipos_campeonato.c.equipo_id)
+        .where(EstadisticaJugador.campeonato_id == campeonato_id)
+    )
+
+
+def _build_response(
     est: EstadisticaJugador,
-    campeonato_id: int
+    equipo: Equipo | None
 ) -> EstadisticaJugadorDetalleResponse:
     """Construye la respuesta enriquecida de una estadística."""
-    equipo = await _get_equipo_jugador(db, est.jugador_id, campeonato_id)
     return EstadisticaJugadorDetalleResponse.model_validate({
         "id": est.id,
         "goles": est.goles,
@@ -50,6 +137,8 @@ async def _build_response(
         "tarjetas_amarillas": est.tarjetas_amarillas,
         "tarjetas_rojas": est.tarjetas_rojas,
         "partidos_jugados": est.partidos_jugados,
+        "minutos_jugados": est.minutos_jugados or 0,
+        "suspensiones": est.suspensiones or 0,
         "jugador": est.jugador,
         "campeonato": est.campeonato,
         "equipo": equipo,
@@ -58,34 +147,87 @@ async def _build_response(
     })
 
 
+async def serializar_estadisticas_campeonato(
+    db: AsyncSession,
+    campeonato_id: int
+) -> bytes:
+    """JSON del listado de estadísticas de un campeonato."""
+    campeonato = (await db.execute(
+        select(Campeonato).where(Campeonato.id == campeonato_id)
+    )).scalar_one_or_none()
+    if not campeonato:
+        raise HTTPException(status_code=404, detail="Campeonato no encontrado")
+
+    filas = (await db.execute(
+        _query_estadisticas_columnas(campeonato_id)
+        .order_by(EstadisticaJugador.goles.desc())
+    )).mappings().all()
+
+    return serializar_lista(
+        EstadisticaJugadorDetalleResponse,
+        (anidar(fila) for fila in filas)
+    )
+
+
 @router.get(
     "/campeonato/{campeonato_id}",
     response_model=List[EstadisticaJugadorDetalleResponse],
     dependencies=[Depends(require_authenticated)]
 )
 async def listar_estadisticas_campeonato(
+    request: Request,
     campeonato_id: int,
     db: AsyncSession = Depends(get_db),
 ):
     """Listar estadísticas de todos los jugadores en un campeonato."""
-    campeonato = (await db.execute(
-        select(Campeonato).where(Campeonato.id == campeonato_id)
-    )).scalar_one_or_none()
-    if not campeonato:
-        raise HTTPException(status_code=404, detail="Campeonato no encontrado")
+    return await respuesta_cacheada(
+        request,
+        f"estadisticas_jugadores:campeonato:{campeonato_id}",
+        lambda: serializar_estadisticas_campeonato(db, campeonato_id)
+    )
 
-    estadisticas = (await db.execute(
-        select(EstadisticaJugador)
-        .options(
-            joinedload(EstadisticaJugador.jugador),
-            joinedload(EstadisticaJugador.campeonato)
+
+@router.get(
+    "/campeonato/{campeonato_id}/lideres",
+    response_model=LideresResponse,
+    dependencies=[Depends(require_authenticated)]
+)
+async def listar_lideres(
+    campeonato_id: int,
+    metrica: str = "goles",
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Tabla de líderes (goleadores, tarjetas, partidos) paginada por cursor.
+    Empates en la métrica se ordenan por id de estadística; el orden usa
+    el índice (campeonato, métrica, id).
+    """
+    if metrica not in METRICAS_LIDERES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Métrica inválida. Debe ser una de: {METRICAS_LIDERES}"
         )
-        .where(EstadisticaJugador.campeonato_id == campeonato_id)
-        .order_by(EstadisticaJugador.goles.desc())
-    )).scalars().all()
 
-    return [await _build_response(
-        db, est, campeonato_id) for est in estadisticas]
+    columna = getattr(EstadisticaJugador, metrica)
+    filas = list((await db.execute(
+        paginar_keyset(
+            _query_estadisticas_con_equipo(campeonato_id),
+            [columna, EstadisticaJugador.id],
+            cursor,
+            limit,
+            descendente=True
+        )
+    )).all())
+    next_cursor = siguiente_cursor(
+        filas, limit, lambda fila: (getattr(fila[0], metrica), fila[0].id))
+
+    return {
+        "metrica": metrica,
+        "items": [_build_response(est, equipo) for est, equipo in filas],
+        "next_cursor": next_cursor
+    }
 
 
 @router.get(
@@ -99,22 +241,72 @@ async def obtener_estadistica_jugador(
     db: AsyncSession = Depends(get_db)
 ):
     """Obtener estadísticas de un jugador en un campeonato específico."""
-    estadistica = (await db.execute(
-        select(EstadisticaJugador)
-        .options(
-            joinedload(EstadisticaJugador.jugador),
-            joinedload(EstadisticaJugador.campeonato)
+    fila = (await db.execute(
+        _query_estadisticas_con_equipo(campeonato_id)
+        .where(EstadisticaJugador.jugador_id == jugador_id)
+    )).first()
+
+    if not fila:
+        raise HTTPException(
+            status_code=404,
+            detail="Estadísticas no encontradas para este jugador"
         )
-        .where(
-            EstadisticaJugador.jugador_id == jugador_id,
-            EstadisticaJugador.campeonato_id == campeonato_id
+
+    return _build_response(*fila)
+
+
+@router.get(
+    "/jugador/{jugador_id}/carrera",
+    response_model=CarreraJugadorResponse,
+    dependencies=[Depends(require_authenticated)]
+)
+async def obtener_carrera_jugador(
+    jugador_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Estadísticas de un jugador en todos sus campeonatos y sus totales.
+    ROLLUP devuelve en la misma consulta una fila por campeonato y una fila
+    final (campeonato nulo) con la suma de la carrera.
+    """
+    totales = [
+        func.coalesce(func.sum(getattr(EstadisticaJugador, campo)), 0)
+        .label(campo)
+        for campo in CAMPOS_CARRERA
+    ]
+    filas = (await db.execute(
+        select(
+            Campeonato.id,
+            Campeonato.nombre,
+            Campeonato.fecha_inicio,
+            *totales
         )
-    )).scalar_one_or_none()
+        .join(Campeonato, EstadisticaJugador.campeonato_id == Campeonato.id)
+        .where(EstadisticaJugador.jugador_id == jugador_id)
+        .group_by(func.rollup(tuple_(
+            Campeonato.id, Campeonato.nombre, Campeonato.fecha_inicio)))
+        .order_by(
+            Campeonato.fecha_inicio.asc().nulls_last(),
+            Campeonato.id.asc().nulls_last()
+        )
+    )).mappings().all()
 
-    if not estadistica:
+    temporadas = [
+        {
+            "campeonato": {"id": fila["id"], "nombre": fila["nombre"]},
+            **{campo: fila[campo] for campo in CAMPOS_CARRERA}
+        }
+        for fila in filas if fila["id"] is not None
+    ]
+    if not temporadas:
         raise HTTPException(
             status_code=404,
             detail="Estadísticas no encontradas para este jugador"
         )
 
-    return await _build_response(db, estadistica, campeonato_id)
+    total = next(fila for fila in filas if fila["id"] is None)
+    return {
+        "jugador_id": jugador_id,
+        "temporadas": temporadas,
+        "totales": {campo: total[campo] for campo in CAMPOS_CARRERA}
+    }
@@ -1,24 +1,126 @@
 """Router de Eventos de Partido."""
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+from collections import Counter
+from typing import List, Optional, Set, Tuple
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.exceptions import RedisError
 
 from app.database import get_db
-from app.models.evento_partido import EventoPartido
+from app.models.evento_partido import (
+    TIPOS_GOL,
+    EventoPartido,
+    equipo_del_gol
+)
 from app.models.partido import Partido
-from app.models.acta_partido import ActaPartido
+from app.models.campeonato import Campeonato
 from app.schemas.evento_partido import (
     EventoPartidoCreate,
+    EventoPartidoLote,
+    EventoPartidoLoteResponse,
     EventoPartidoResponse,
-    EventoPartidoDetalleResponse
+    EventoPartidoDetalleResponse,
+    LineaTiempoResponse
 )
 from app.core.dependencies import require_authenticated, require_admin
+from app.services.contexto_partido_service import (
+    ContextoPartido,
+    obtener_contexto
+)
+from app.services.linea_tiempo_service import obtener_linea_tiempo
+from app.services.partido_service import (
+    actualizar_marcador,
+    verificar_en_curso
+)
+from app.services.en_vivo_service import (
+    publicar_evento,
+    publicar_marcador,
+    stream_campeonato,
+    stream_partido,
+    transmitir_eventos,
+    validar_ultimo_id
+)
 
 router = APIRouter(prefix="/eventos-partido", tags=["Eventos de Partido"])
+logger = logging.getLogger(__name__)
+
+TIPOS_VALIDOS = [
+    "Gol",
+    "Autogol",
+    "TarjetaAmarilla",
+    "TarjetaRoja",
+    "Cambio"
+]
+
+
+def _error_estado(partido: ContextoPartido) -> str | None:
+    """No se registran eventos en partidos finalizados o programados."""
+    if partido.estado == "Finalizado":
+        return "No se pueden registrar eventos en un partido finalizado"
+    if partido.estado == "Programado":
+        return "No se pueden registrar eventos en un partido programado"
+    return None
+
+
+def _error_evento(
+    datos,
+    partido: ContextoPartido,
+    convocados: Set[Tuple[int, int]]
+) -> str | None:
+    """
+    Valida un evento contra el contexto del partido, sin consultas.
+    Devuelve el mensaje de error, o None si el evento es válido.
+    """
+    # Verificar tipo válido
+    if datos.tipo not in TIPOS_VALIDOS:
+        return f"Tipo inválido. Debe ser uno de: {TIPOS_VALIDOS}"
+
+    # Verificar que el equipo es parte del partido
+    if datos.equipo_id not in partido.equipos:
+        return "El equipo no es parte de este partido"
+
+    # Verificar que el jugador está en el acta del partido
+    if (datos.jugador_id, datos.equipo_id) not in convocados:
+        return "El jugador no está convocado en el acta de este partido"
+
+    # Si es cambio, verificar que jugador_sale_id esté presente y en el acta
+    if datos.tipo == "Cambio":
+        if not datos.jugador_sale_id:
+            return "Para un cambio se requiere jugador_sale_id"
+        if (datos.jugador_sale_id, datos.equipo_id) not in convocados:
+            return "El jugador que sale no está convocado en el acta"
 
-TIPOS_VALIDOS = ["Gol", "TarjetaAmarilla", "TarjetaRoja", "Cambio"]
+    # Si es gol con asistencia, verificar que el asistente esté en el acta
+    if datos.tipo == "Gol" and datos.asistente_id:
+        if datos.asistente_id == datos.jugador_id:
+            return "El asistente no puede ser el mismo goleador"
+        if (datos.asistente_id, datos.equipo_id) not in convocados:
+            return "El asistente no está convocado en el acta"
+    return None
+
+
+def _fila_evento(datos, partido_id: int) -> dict:
+    """Normaliza jugador_sale_id y asistente_id según el tipo."""
+    fila = datos.model_dump()
+    fila["partido_id"] = partido_id
+    if datos.tipo != "Cambio":
+        fila["jugador_sale_id"] = None
+    if datos.tipo != "Gol":
+        fila["asistente_id"] = None
+    return fila
+
+
+def _resumen_evento(evento: EventoPartido) -> dict:
+    """Datos del evento que acompañan al marcador en vivo."""
+    return {
+        "tipo": evento.tipo,
+        "minuto": evento.minuto,
+        "equipo_id": evento.equipo_id
+    }
 
 
 @router.post(
@@ -32,86 +134,120 @@ async def registrar_evento(
     db: AsyncSession = Depends(get_db)
 ):
     """Registrar un evento en un partido."""
-    # Verificar que el partido existe
-    partido = (await db.execute(
-        select(Partido).where(Partido.id == datos.partido_id)
-    )).scalar_one_or_none()
+    # Verificar que el partido existe (contexto en caché)
+    partido = await obtener_contexto(db, datos.partido_id)
     if not partido:
         raise HTTPException(status_code=404, detail="Partido no encontrado")
 
-    # No se puede registrar eventos en un partido finalizado o programado
-    if partido.estado == "Finalizado":
-        raise HTTPException(
-            status_code=400,
-            detail="No se pueden registrar eventos en un partido finalizado"
-        )
-    if partido.estado == "Programado":
-        raise HTTPException(
-            status_code=400,
-            detail="No se pueden registrar eventos en un partido programado"
-        )
+    error = _error_estado(partido) or _error_evento(
+        datos, partido, partido.pares_convocados())
+    if error:
+        raise HTTPException(status_code=400, detail=error)
 
-    # Verificar tipo válido
-    if datos.tipo not in TIPOS_VALIDOS:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Tipo inválido. Debe ser uno de: {TIPOS_VALIDOS}"
-        )
+    db_evento = EventoPartido(**_fila_evento(datos, partido.id))
+    db.add(db_evento)
+    # El estado se confirma en la base: el contexto puede estar desfasado
+    if datos.tipo in TIPOS_GOL:
+        equipo_id = equipo_del_gol(partido, datos.tipo, datos.equipo_id)
+        await actualizar_marcador(db, partido, equipo_id, 1)
+    else:
+        await verificar_en_curso(db, partido.id)
+    await db.commit()
+    await db.refresh(db_evento)
 
-    # Verificar que el equipo es parte del partido
-    if datos.equipo_id not in [
-            partido.equipo_local_id, partido.equipo_visitante_id]:
-        raise HTTPException(
-            status_code=400,
-            detail="El equipo no es parte de este partido"
+    # El evento ya está guardado: si Redis falla solo se pierde el aviso en
+    # vivo; responder con error haría que el cliente lo registre dos veces
+    try:
+        await publicar_evento(
+            "evento_registrado", partido.id, partido.campeonato_id,
+            EventoPartidoResponse.model_validate(db_evento).model_dump(
+                mode="json")
         )
+        await publicar_marcador(partido, evento=_resumen_evento(db_evento))
+    except RedisError:
+        logger.exception(
+            "No se pudo publicar el evento %s en vivo", db_evento.id)
+    return db_evento
 
-    # Verificar que el jugador está en el acta del partido
-    en_acta = (await db.execute(
-        select(ActaPartido).where(
-            ActaPartido.partido_id == datos.partido_id,
-            ActaPartido.jugador_id == datos.jugador_id,
-            ActaPartido.equipo_id == datos.equipo_id,
-            ActaPartido.convocado.is_(True)
-        )
-    )).scalar_one_or_none()
-    if not en_acta:
+
+@router.post(
+    "/batch",
+    response_model=EventoPartidoLoteResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_admin)]
+)
+async def registrar_eventos_lote(
+    datos: EventoPartidoLote,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Registrar varios eventos de un partido en una sola petición.
+    Todo el lote se valida contra el acta del contexto y se inserta con
+    una sola sentencia. Es idempotente por id_cliente: al reintentar, los
+    eventos ya registrados se informan como duplicados y no se repiten.
+    """
+    partido = await obtener_contexto(db, datos.partido_id)
+    if not partido:
+        raise HTTPException(status_code=404, detail="Partido no encontrado")
+
+    error = _error_estado(partido)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+
+    ids_cliente = [evento.id_cliente for evento in datos.eventos]
+    if len(set(ids_cliente)) != len(ids_cliente):
         raise HTTPException(
             status_code=400,
-            detail="El jugador no está convocado en el acta de este partido"
+            detail="Hay id_cliente repetidos en el lote"
         )
 
-    # Si es cambio, verificar que jugador_sale_id esté presente y en el acta
-    if datos.tipo == "Cambio":
-        if not datos.jugador_sale_id:
+    convocados = partido.pares_convocados()
+    for evento in datos.eventos:
+        error = _error_evento(evento, partido, convocados)
+        if error:
             raise HTTPException(
                 status_code=400,
-                detail="Para un cambio se requiere jugador_sale_id"
-            )
-        jugador_sale = (await db.execute(
-            select(ActaPartido).where(
-                ActaPartido.partido_id == datos.partido_id,
-                ActaPartido.jugador_id == datos.jugador_sale_id,
-                ActaPartido.equipo_id == datos.equipo_id,
-                ActaPartido.convocado.is_(True)
-            )
-        )).scalar_one_or_none()
-        if not jugador_sale:
-            raise HTTPException(
-                status_code=400,
-                detail="El jugador que sale no está convocado en el acta"
+                detail=f"Evento {evento.id_cliente}: {error}"
             )
 
-    # Normalizar jugador_sale_id a None si no es Cambio
-    datos_dict = datos.model_dump()
-    if datos.tipo != "Cambio":
-        datos_dict["jugador_sale_id"] = None
+    creados = list(await db.scalars(
+        insert(EventoPartido)
+        .on_conflict_do_nothing(
+            index_elements=["partido_id", "id_cliente"])
+        .returning(EventoPartido),
+        [_fila_evento(evento, partido.id) for evento in datos.eventos]
+    ))
 
-    db_evento = EventoPartido(**datos_dict)
-    db.add(db_evento)
+    # Un solo UPDATE por equipo con todos los goles nuevos del lote
+    goles = Counter(
+        equipo_del_gol(partido, e.tipo, e.equipo_id)
+        for e in creados if e.tipo in TIPOS_GOL
+    )
+    for equipo_id, cantidad in goles.items():
+        await actualizar_marcador(db, partido, equipo_id, cantidad)
+    if not goles:
+        await verificar_en_curso(db, partido.id)
     await db.commit()
-    await db.refresh(db_evento)
-    return db_evento
+
+    try:
+        for evento in creados:
+            await publicar_evento(
+                "evento_registrado", partido.id, partido.campeonato_id,
+                EventoPartidoResponse.model_validate(evento).model_dump(
+                    mode="json")
+            )
+        if creados:
+            await publicar_marcador(
+                partido, evento=_resumen_evento(creados[-1]))
+    except RedisError:
+        logger.exception(
+            "No se pudo publicar en vivo el lote del partido %s", partido.id)
+
+    registrados = {evento.id_cliente for evento in creados}
+    return {
+        "creados": creados,
+        "duplicados": [i for i in ids_cliente if i not in registrados]
+    }
 
 
 @router.get(
@@ -134,8 +270,11 @@ async def listar_eventos_partido(
     query = select(EventoPartido).options(
         joinedload(EventoPartido.jugador),
         joinedload(EventoPartido.equipo),
-        joinedload(EventoPartido.jugador_sale)
-    ).where(EventoPartido.partido_id == partido_id)
+        joinedload(EventoPartido.jugador_sale),
+        joinedload(EventoPartido.asistente)
+    ).where(
+        EventoPartido.partido_id == partido_id
+    ).order_by(EventoPartido.minuto.asc().nulls_last(), EventoPartido.id)
     if tipo:
         if tipo not in TIPOS_VALIDOS:
             raise HTTPException(
@@ -148,6 +287,89 @@ async def listar_eventos_partido(
     return result.scalars().all()
 
 
+@router.get(
+    "/partido/{partido_id}/linea-tiempo",
+    response_model=LineaTiempoResponse,
+    dependencies=[Depends(require_authenticated)]
+)
+async def linea_tiempo_partido(
+    partido_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Eventos del partido ordenados por minuto, con el marcador parcial y
+    los jugadores en cancha. Se calcula una vez al finalizar el partido.
+    """
+    partido = (await db.execute(
+        select(Partido).where(Partido.id == partido_id)
+    )).scalar_one_or_none()
+    if not partido:
+        raise HTTPException(status_code=404, detail="Partido no encontrado")
+    return await obtener_linea_tiempo(db, partido)
+
+
+async def _respuesta_sse(
+    request: Request,
+    db: AsyncSession,
+    clave: str,
+    ultimo_id: str | None
+) -> StreamingResponse:
+    """
+    Respuesta Server-Sent Events de un stream en vivo. La sesión se cierra
+    antes para no retener una conexión de la base por cada espectador.
+    """
+    ultimo_id = validar_ultimo_id(ultimo_id)
+    await db.close()
+    return StreamingResponse(
+        transmitir_eventos(clave, ultimo_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get(
+    "/partido/{partido_id}/stream",
+    dependencies=[Depends(require_authenticated)]
+)
+async def stream_eventos_partido(
+    request: Request,
+    partido_id: int,
+    last_event_id: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Eventos del partido en vivo (Server-Sent Events).
+    Al reconectar con Last-Event-ID se reenvía lo que se haya perdido.
+    """
+    partido = (await db.execute(
+        select(Partido.id).where(Partido.id == partido_id)
+    )).scalar_one_or_none()
+    if not partido:
+        raise HTTPException(status_code=404, detail="Partido no encontrado")
+    return await _respuesta_sse(
+        request, db, stream_partido(partido_id), last_event_id)
+
+
+@router.get(
+    "/campeonato/{campeonato_id}/stream",
+    dependencies=[Depends(require_authenticated)]
+)
+async def stream_eventos_campeonato(
+    request: Request,
+    campeonato_id: int,
+    last_event_id: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """Eventos en vivo de todos los partidos de un campeonato (SSE)."""
+    campeonato = (await db.execute(
+        select(Campeonato.id).where(Campeonato.id == campeonato_id)
+    )).scalar_one_or_none()
+    if not campeonato:
+        raise HTTPException(status_code=404, detail="Campeonato no encontrado")
+    return await _respuesta_sse(
+        request, db, stream_campeonato(campeonato_id), last_event_id)
+
+
 @router.delete(
     "/{evento_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -165,9 +387,7 @@ async def eliminar_evento(
         raise HTTPException(status_code=404, detail="Evento no encontrado")
 
     # Verificar que el partido no esté finalizado
-    partido = (await db.execute(
-        select(Partido).where(Partido.id == db_evento.partido_id)
-    )).scalar_one_or_none()
+    partido = await obtener_contexto(db, db_evento.partido_id)
     if partido.estado == "Finalizado":
         raise HTTPException(
             status_code=400,
@@ -175,5 +395,21 @@ async def eliminar_evento(
         )
 
     await db.delete(db_evento)
+    if db_evento.tipo in TIPOS_GOL:
+        equipo_id = equipo_del_gol(
+            partido, db_evento.tipo, db_evento.equipo_id)
+        await actualizar_marcador(db, partido, equipo_id, -1)
+    else:
+        await verificar_en_curso(db, partido.id)
     await db.commit()
+
+    try:
+        await publicar_evento(
+            "evento_eliminado", partido.id, partido.campeonato_id,
+            {"id": evento_id}
+        )
+        await publicar_marcador(partido)
+    except RedisError:
+        logger.exception(
+            "No se pudo publicar la eliminación del evento %s", evento_id)
     return None
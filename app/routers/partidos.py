@@ -1,27 +1,104 @@
 """Router de Partidos."""
+import logging
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import Response, WebSocket, status
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
+from redis.exceptions import RedisError
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db
 from app.models.partido import Partido
 from app.models.campeonato import Campeonato
 from app.models.equipo import Equipo
 from app.schemas.partido import (
+    FixtureCreate,
+    MarcadorResponse,
     PartidoCreate,
     PartidoDetalleResponse,
     PartidoUpdate,
     PartidoResponse
 )
 from app.core.dependencies import require_authenticated, require_admin
-from app.services.partido_service import finalizar_partido
+from app.routers.auth import usuario_desde_token
+from app.core.pagination import (
+    contar_total,
+    paginar_keyset,
+    paginar_resultado
+)
+from app.core.responses import (
+    SEPARADOR,
+    anidar,
+    modelo_parcial,
+    parsear_campos,
+    respuesta_json,
+    serializar_lista
+)
+from app.services.fixture_service import (
+    FORMATOS_FIXTURE,
+    filas_partidos,
+    ida_y_vuelta,
+    por_series,
+    todos_contra_todos
+)
+from app.services.contexto_partido_service import invalidar_contexto
+from app.services.en_vivo_service import (
+    ColaMarcador,
+    atender_tablero,
+    canal_marcador,
+    datos_marcador,
+    difusor,
+    publicar_marcador
+)
+from app.services.partido_service import (
+    finalizar_partido,
+    reabrir_partido
+)
 
 router = APIRouter(prefix="/partidos", tags=["Partidos"])
+logger = logging.getLogger(__name__)
 
 ESTADOS_VALIDOS = ["Programado", "En curso", "Finalizado", "Suspendido"]
 
+# Columnas de cada relación que se anidan en PartidoDetalleResponse
+COLUMNAS_RELACION = {
+    "campeonato": ("id", "nombre"),
+    "equipo_local": ("id", "nombre", "logo_url"),
+    "equipo_visitante": ("id", "nombre", "logo_url"),
+}
+
+
+def _query_partidos_campos(campos):
+    """
+    SELECT de solo las columnas pedidas; las relaciones se unen únicamente
+    si se solicitan. id y jornada siempre se leen para paginar.
+    """
+    columnas = {
+        "id": Partido.id.label("id"),
+        "jornada": Partido.jornada.label("jornada")
+    }
+    joins = []
+    for campo in campos:
+        if campo not in COLUMNAS_RELACION:
+            columnas[campo] = getattr(Partido, campo).label(campo)
+            continue
+        if campo == "campeonato":
+            destino = Campeonato
+            condicion = Partido.campeonato_id == Campeonato.id
+        else:
+            destino = aliased(Equipo, name=campo)
+            condicion = getattr(Partido, f"{campo}_id") == destino.id
+        joins.append((destino, condicion))
+        for columna in COLUMNAS_RELACION[campo]:
+            etiqueta = f"{campo}{SEPARADOR}{columna}"
+            columnas[etiqueta] = getattr(destino, columna).label(etiqueta)
+
+    query = select(*columnas.values()).select_from(Partido)
+    for destino, condicion in joins:
+        query = query.join(destino, condicion)
+    return query
+
 
 @router.post(
     "/",
@@ -88,34 +165,163 @@ async def crear_partido(
     return db_partido
 
 
+@router.post(
+    "/fixture",
+    response_model=List[PartidoResponse],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_admin)]
+)
+async def generar_fixture(
+    datos: FixtureCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Generar el calendario completo de un campeonato sin partidos.
+    Valida todos los equipos con una sola consulta e inserta todos los
+    partidos con un único INSERT.
+    """
+    if datos.formato not in FORMATOS_FIXTURE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Formato inválido. Debe ser uno de: {FORMATOS_FIXTURE}"
+        )
+
+    # Equipos del campeonato (un campeonato sin equipos no tiene fixture)
+    equipos_campeonato = set((await db.execute(
+        select(Equipo.id).where(Equipo.campeonato_id == datos.campeonato_id)
+    )).scalars().all())
+    if not equipos_campeonato:
+        raise HTTPException(
+            status_code=404,
+            detail="Campeonato no encontrado o sin equipos"
+        )
+
+    # Un campeonato con partidos ya tiene fixture: no se genera otro encima.
+    # El bloqueo del campeonato evita que dos solicitudes simultáneas lo
+    # dupliquen.
+    await db.execute(
+        select(Campeonato.id)
+        .where(Campeonato.id == datos.campeonato_id)
+        .with_for_update()
+    )
+    if (await db.execute(
+        select(Partido.id)
+        .where(Partido.campeonato_id == datos.campeonato_id)
+        .limit(1)
+    )).first() is not None:
+        raise HTTPException(
+            status_code=409,
+            detail="El campeonato ya tiene partidos; no se puede generar "
+                   "otro fixture"
+        )
+
+    if datos.formato == "series":
+        if not datos.series:
+            raise HTTPException(
+                status_code=400,
+                detail="El formato series requiere el campo series"
+            )
+        solicitados = [e for equipos in datos.series.values() for e in equipos]
+    else:
+        solicitados = datos.equipo_ids or sorted(equipos_campeonato)
+
+    if len(solicitados) != len(set(solicitados)):
+        raise HTTPException(
+            status_code=400,
+            detail="Hay equipos repetidos en la solicitud"
+        )
+    ajenos = set(solicitados) - equipos_campeonato
+    if ajenos:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Equipos no encontrados en el campeonato: {sorted(ajenos)}"
+        )
+
+    if datos.formato == "series":
+        if any(len(equipos) < 2 for equipos in datos.series.values()):
+            raise HTTPException(
+                status_code=400,
+                detail="Cada serie necesita al menos dos equipos"
+            )
+        calendario = por_series(datos.series, datos.doble_vuelta)
+    else:
+        if len(solicitados) < 2:
+            raise HTTPException(
+                status_code=400,
+                detail="Se necesitan al menos dos equipos"
+            )
+        generador = (
+            ida_y_vuelta if datos.formato == "ida_y_vuelta"
+            else todos_contra_todos
+        )
+        calendario = generador(solicitados)
+
+    filas = filas_partidos(
+        datos.campeonato_id,
+        calendario,
+        jornada_inicial=datos.jornada_inicial,
+        fecha_inicio=datos.fecha_inicio,
+        dias_entre_jornadas=datos.dias_entre_jornadas,
+        lugar=datos.lugar
+    )
+    partidos = (await db.scalars(
+        insert(Partido).returning(Partido), filas
+    )).all()
+    await db.commit()
+    return partidos
+
+
 @router.get(
     "/",
     response_model=List[PartidoDetalleResponse],
     dependencies=[Depends(require_authenticated)]
 )
 async def listar_partidos(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    count: str = "none",
     campeonato_id: Optional[int] = None,
     jornada: Optional[int] = None,
     estado: Optional[str] = None,
+    fields: Optional[str] = Query(
+        None, description="Campos a devolver separados por coma, "
+                          "p. ej. id,goles_local,goles_visitante"),
     db: AsyncSession = Depends(get_db)
 ):
-    """Listar partidos con filtros opcionales."""
-    query = select(Partido).options(
-        joinedload(Partido.campeonato),
-        joinedload(Partido.equipo_local),
-        joinedload(Partido.equipo_visitante)
-    )
+    """
+    Listar partidos con filtros opcionales, ordenados por jornada.
+    Es de solo lectura: se seleccionan columnas y se serializan sin crear
+    instancias ORM.
+    """
+    esquema = PartidoDetalleResponse
+    campos = tuple(PartidoDetalleResponse.model_fields)
+    if fields:
+        campos = parsear_campos(fields, PartidoDetalleResponse)
+        esquema = modelo_parcial(PartidoDetalleResponse, campos)
+    query = _query_partidos_campos(campos)
     if campeonato_id:
         query = query.where(Partido.campeonato_id == campeonato_id)
     if jornada:
         query = query.where(Partido.jornada == jornada)
     if estado:
         query = query.where(Partido.estado == estado)
-    query = query.offset(skip).limit(limit)
+    await contar_total(db, response, query, count)
+    query = paginar_keyset(
+        query, [Partido.jornada, Partido.id], cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
     result = await db.execute(query)
-    return result.scalars().all()
+
+    filas = paginar_resultado(
+        request, response, list(result.mappings().all()), limit,
+        lambda f: (f["jornada"], f["id"]))
+    return respuesta_json(
+        serializar_lista(esquema, (anidar(fila) for fila in filas)),
+        base=response
+    )
 
 
 @router.get(
@@ -142,6 +348,29 @@ async def obtener_partido(
     return partido
 
 
+@router.get(
+    "/{partido_id}/marcador",
+    response_model=MarcadorResponse,
+    dependencies=[Depends(require_authenticated)]
+)
+async def obtener_marcador(
+    partido_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Marcador en vivo de un partido (una sola fila, sin contar eventos)."""
+    marcador = (await db.execute(
+        select(
+            Partido.id.label("partido_id"),
+            Partido.estado,
+            func.coalesce(Partido.goles_local, 0).label("goles_local"),
+            func.coalesce(Partido.goles_visitante, 0).label("goles_visitante")
+        ).where(Partido.id == partido_id)
+    )).mappings().one_or_none()
+    if not marcador:
+        raise HTTPException(status_code=404, detail="Partido no encontrado")
+    return marcador
+
+
 @router.put(
     "/{partido_id}",
     response_model=PartidoDetalleResponse,
@@ -174,6 +403,7 @@ async def actualizar_partido(
         )
 
     # Dentro de actualizar_partido, antes del commit:
+    jornada_anterior = db_partido.jornada
     update_data = datos.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_partido, field, value)
@@ -182,6 +412,96 @@ async def actualizar_partido(
         await finalizar_partido(db, db_partido)
     else:
         await db.commit()
+    await invalidar_contexto(partido_id)
+    # El cambio ya está guardado: un fallo de Redis solo pierde el aviso
+    try:
+        await publicar_marcador(db_partido, jornada_anterior=jornada_anterior)
+    except RedisError:
+        logger.exception(
+            "No se pudo publicar el marcador del partido %s", partido_id)
+
+    return (await db.execute(
+        select(Partido)
+        .options(
+            joinedload(Partido.campeonato),
+            joinedload(Partido.equipo_local),
+            joinedload(Partido.equipo_visitante)
+        )
+        .where(Partido.id == partido_id)
+    )).scalar_one()
+
+
+@router.websocket("/campeonato/{campeonato_id}/jornada/{jornada}/ws")
+async def tablero_jornada(
+    websocket: WebSocket,
+    campeonato_id: int,
+    jornada: int,
+    token: str = Query(...)
+):
+    """
+    Tablero en vivo de una jornada. Envía el estado de todos sus partidos y
+    luego solo los cambios de marcador y estado, fusionados por partido.
+    El token va como parámetro porque el navegador no envía encabezados.
+    """
+    # Misma validación que require_authenticated, antes de suscribirse
+    async with AsyncSessionLocal() as db:
+        usuario = await usuario_desde_token(db, token)
+    if usuario is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    # Suscribirse antes de leer el estado para no perder cambios
+    clave = canal_marcador(campeonato_id, jornada)
+    receptor = ColaMarcador()
+    difusor.suscribir(clave, receptor)
+    try:
+        await difusor.esperar_suscripcion()
+        # Sesión corta: no se retiene una conexión por cada tablero abierto
+        async with AsyncSessionLocal() as db:
+            partidos = (await db.execute(
+                select(Partido)
+                .where(
+                    Partido.campeonato_id == campeonato_id,
+                    Partido.jornada == jornada
+                )
+                .order_by(Partido.id)
+            )).scalars().all()
+        await websocket.accept()
+        await atender_tablero(
+            websocket, receptor, [datos_marcador(p) for p in partidos])
+    finally:
+        difusor.desuscribir(clave, receptor)
+
+
+@router.post(
+    "/{partido_id}/reabrir",
+    response_model=PartidoDetalleResponse,
+    dependencies=[Depends(require_admin)]
+)
+async def reabrir(
+    partido_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Reabrir un partido finalizado revirtiendo su aporte a estadísticas."""
+    db_partido = (await db.execute(
+        select(Partido).where(Partido.id == partido_id).with_for_update()
+    )).scalar_one_or_none()
+    if not db_partido:
+        raise HTTPException(status_code=404, detail="Partido no encontrado")
+
+    if db_partido.estado != "Finalizado":
+        raise HTTPException(
+            status_code=400,
+            detail="Solo se puede reabrir un partido finalizado"
+        )
+
+    await reabrir_partido(db, db_partido)
+    await invalidar_contexto(partido_id)
+    try:
+        await publicar_marcador(db_partido)
+    except RedisError:
+        logger.exception(
+            "No se pudo publicar el marcador del partido %s", partido_id)
 
     return (await db.execute(
         select(Partido)
@@ -219,4 +539,5 @@ async def eliminar_partido(
 
     await db.delete(db_partido)
     await db.commit()
+    await invalidar_contexto(partido_id)
     return None
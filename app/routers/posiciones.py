@@ -1,21 +1,27 @@
 """Router de Posiciones."""
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.posicion import Posicion
+from app.models.posicion_jornada import PosicionJornada
 from app.models.campeonato import Campeonato
 from app.models.equipo import Equipo
 from app.schemas.posiciones import (
     PosicionCreate,
     PosicionResponse,
     PosicionUpdate,
-    PosicionDetalleResponse
+    PosicionDetalleResponse,
+    PosicionJornadaResponse
 )
 from app.core.dependencies import require_authenticated, require_admin
+from app.core.cache import invalidar_cache_campeonato
+from app.core.redis import get_redis
+from app.core.responses import respuesta_cacheada, serializar_lista
+from app.services.posiciones_service import recalcular_puestos
 
 router = APIRouter(prefix="/posiciones", tags=["Posiciones"])
 
@@ -66,7 +72,10 @@ async def crear_posicion(
 
     db_posicion = Posicion(**datos.model_dump())
     db.add(db_posicion)
+    await db.flush()
+    await recalcular_puestos(db, datos.campeonato_id)
     await db.commit()
+    await invalidar_cache_campeonato(await get_redis(), datos.campeonato_id)
     await db.refresh(db_posicion)
     return db_posicion
 
@@ -77,32 +86,102 @@ async def crear_posicion(
     dependencies=[Depends(require_authenticated)]
 )
 async def tabla_posiciones(
+    request: Request,
     campeonato_id: int,
     serie: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ):
     """Obtener tabla de posiciones de un campeonato ordenada por puntos."""
-    campeonato = (await db.execute(
-        select(Campeonato).where(Campeonato.id == campeonato_id)
-    )).scalar_one_or_none()
-    if not campeonato:
-        raise HTTPException(status_code=404, detail="Campeonato no encontrado")
+    async def generar() -> bytes:
+        campeonato = (await db.execute(
+            select(Campeonato).where(Campeonato.id == campeonato_id)
+        )).scalar_one_or_none()
+        if not campeonato:
+            raise HTTPException(
+                status_code=404, detail="Campeonato no encontrado")
+
+        query = select(Posicion).options(
+            joinedload(Posicion.equipo),
+            joinedload(Posicion.campeonato)
+        ).where(Posicion.campeonato_id == campeonato_id)
+        if serie:
+            query = query.where(Posicion.serie == serie)
+
+        # Puesto materializado al finalizar cada partido (ver índice)
+        query = query.order_by(
+            Posicion.serie,
+            Posicion.puesto,
+            Posicion.id
+        )
 
-    query = select(Posicion).options(
-        joinedload(Posicion.equipo),
-        joinedload(Posicion.campeonato)
-    ).where(Posicion.campeonato_id == campeonato_id)
-    if serie:
-        query = query.where(Posicion.serie == serie)
-
-    # Ordenar por puntos desc, luego por diferencia de goles desc
-    query = query.order_by(
-        Posicion.puntos.desc(),
-        (Posicion.goles_favor - Posicion.goles_contra).desc()
+        result = await db.execute(query)
+        return serializar_lista(
+            PosicionDetalleResponse, result.scalars().all())
+
+    return await respuesta_cacheada(
+        request,
+        f"posiciones:campeonato:{campeonato_id}:serie:{serie or ''}",
+        generar
     )
 
-    result = await db.execute(query)
-    return result.scalars().all()
+
+@router.get(
+    "/campeonato/{campeonato_id}/jornada/{jornada}",
+    response_model=List[PosicionJornadaResponse],
+    dependencies=[Depends(require_authenticated)]
+)
+async def tabla_posiciones_jornada(
+    request: Request,
+    campeonato_id: int,
+    jornada: int,
+    serie: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Obtener la tabla de posiciones tal como quedó tras una jornada."""
+    async def generar() -> bytes:
+        campeonato = (await db.execute(
+            select(Campeonato).where(Campeonato.id == campeonato_id)
+        )).scalar_one_or_none()
+        if not campeonato:
+            raise HTTPException(
+                status_code=404, detail="Campeonato no encontrado")
+
+        # Si en esa jornada no se finalizó ningún partido, vale la anterior
+        ultima_jornada = (
+            select(PosicionJornada.jornada)
+            .where(
+                PosicionJornada.campeonato_id == campeonato_id,
+                PosicionJornada.jornada <= jornada
+            )
+            .order_by(PosicionJornada.jornada.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        query = select(PosicionJornada).options(
+            joinedload(PosicionJornada.equipo)
+        ).where(
+            PosicionJornada.campeonato_id == campeonato_id,
+            PosicionJornada.jornada == ultima_jornada
+        )
+        if serie:
+            query = query.where(PosicionJornada.serie == serie)
+
+        query = query.order_by(
+            PosicionJornada.serie,
+            PosicionJornada.puesto,
+            PosicionJornada.id
+        )
+
+        result = await db.execute(query)
+        return serializar_lista(
+            PosicionJornadaResponse, result.scalars().all())
+
+    return await respuesta_cacheada(
+        request,
+        f"posiciones:campeonato:{campeonato_id}:jornada:{jornada}"
+        f":serie:{serie or ''}",
+        generar
+    )
 
 
 @router.get(
@@ -148,6 +227,9 @@ async def actualizar_posicion(
     for field, value in update_data.items():
         setattr(db_posicion, field, value)
 
+    await recalcular_puestos(db, db_posicion.campeonato_id)
     await db.commit()
+    await invalidar_cache_campeonato(
+        await get_redis(), db_posicion.campeonato_id)
     await db.refresh(db_posicion)
     return db_posicion
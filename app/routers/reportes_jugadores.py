@@ -1,9 +1,15 @@
 """Router de Reportes de Jugadores."""
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core.pagination import (
+    contar_total,
+    paginar_keyset,
+    paginar_resultado
+)
 from app.database import get_db
 from app.models.campeonato import Campeonato
 from app.models.reporte_jugador import ReporteJugador
@@ -58,8 +64,12 @@ async def crear_reporte_jugador(
 
 @router.get("/", response_model=List[ReporteJugadorResponse])
 async def listar_reportes(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = None,
+    count: str = "none",
     jugador_id: int | None = None,
     campeonato_id: int | None = None,
     db: AsyncSession = Depends(get_db)
@@ -73,9 +83,14 @@ async def listar_reportes(
     if campeonato_id is not None:
         query = query.where(ReporteJugador.campeonato_id == campeonato_id)
 
-    query = query.offset(skip).limit(limit)
+    await contar_total(db, response, query, count)
+    query = paginar_keyset(query, [ReporteJugador.id], cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
     result = await db.execute(query)
-    return result.scalars().all()
+    return paginar_resultado(
+        request, response, list(result.scalars().all()), limit,
+        lambda r: (r.id,))
 
 
 @router.get("/{reporte_id}", response_model=ReporteJugadorResponse)
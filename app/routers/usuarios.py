@@ -1,6 +1,7 @@
 """Routes de usuarios."""
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -9,6 +10,11 @@ from app.database import get_db
 from app.models.usuario import Usuario
 from app.schemas.usuario import UsuarioCreate, UsuarioUpdate, UsuarioResponse
 from app.core.dependencies import require_admin, require_authenticated
+from app.core.pagination import (
+    contar_total,
+    paginar_keyset,
+    paginar_resultado
+)
 
 
 router = APIRouter(prefix="/usuarios", tags=["Usuarios"])
@@ -54,14 +60,23 @@ async def crear_usuario(
     dependencies=[Depends(require_authenticated)]
 )
 async def listar_usuarios(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    count: str = "none",
     db: AsyncSession = Depends(get_db)
 ):
-    """Listar todos los usuarios."""
-    return (await db.execute(
-        select(Usuario).offset(skip).limit(limit)
-    )).scalars().all()
+    """Listar todos los usuarios. Paginado por cursor (ver Link)."""
+    query = select(Usuario)
+    await contar_total(db, response, query, count)
+    query = paginar_keyset(query, [Usuario.id], cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
+    filas = list((await db.execute(query)).scalars().all())
+    return paginar_resultado(
+        request, response, filas, limit, lambda u: (u.id,))
 
 
 @router.get(
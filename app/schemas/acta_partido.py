@@ -1,7 +1,7 @@
 """Schemas de ActaPartido."""
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 
 
 class JugadorResumen(BaseModel):
@@ -38,6 +38,26 @@ class ActaPartidoCreate(ActaPartidoBase):
     """Esquema para crear un registro en el acta."""
 
 
+class JugadorConvocado(BaseModel):
+    """Jugador de una convocatoria enviada en bloque."""
+    jugador_id: int
+    titular: Optional[bool] = False
+
+
+class ActaPartidoLoteCreate(BaseModel):
+    """Esquema para cargar la convocatoria completa de un equipo."""
+    partido_id: int
+    equipo_id: int
+    jugadores: List[JugadorConvocado] = Field(
+        ..., min_length=1, max_length=60)
+
+
+class ActaPartidoCopiar(BaseModel):
+    """Esquema para copiar el acta de un equipo desde su partido anterior."""
+    partido_id: int
+    equipo_id: int
+
+
 class ActaPartidoUpdate(BaseModel):
     """Esquema para actualizar un registro del acta."""
     convocado: Optional[bool] = None
@@ -67,3 +87,16 @@ class ActaPartidoDetalleResponse(BaseModel):
     class Config:
         """Permite crear el modelo a partir de objetos con atributos."""
         from_attributes = True
+
+
+class JugadorInhabilitadoResponse(BaseModel):
+    """Jugador suspendido para una jornada."""
+    jugador: JugadorResumen
+    partido_id: int
+    jornada_desde: int
+    jornada_hasta: int
+    motivo: Optional[str] = None
+
+    class Config:
+        """Permite crear el modelo a partir de objetos con atributos."""
+        from_attributes = True
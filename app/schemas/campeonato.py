@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field
+from app.models.campeonato import CRITERIOS_DESEMPATE_DEFECTO
 
 
 class CampeonatoBase(BaseModel):
@@ -16,6 +17,11 @@ class CampeonatoBase(BaseModel):
         default="activo",
         description="activo, suspendido, finalizado"
     )
+    criterios_desempate: Optional[str] = Field(
+        default=CRITERIOS_DESEMPATE_DEFECTO,
+        description="Separados por coma: diferencia_goles, goles_favor, "
+                    "ganados, enfrentamiento_directo"
+    )
 
 
 class CampeonatoCreate(CampeonatoBase):
@@ -31,6 +37,7 @@ class CampeonatoUpdate(CampeonatoBase):
     canton: Optional[str] = None
     parroquia: Optional[str] = None
     estado: Optional[str] = None
+    criterios_desempate: Optional[str] = None
 
 
 class CampeonatoResponse(CampeonatoBase):
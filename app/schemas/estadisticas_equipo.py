@@ -1,7 +1,7 @@
 """Schemas de EstadisticaEquipo."""
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 
 
 class EquipoResumen(BaseModel):
@@ -64,16 +64,39 @@ class EstadisticaEquipoResponse(EstadisticaEquipoBase):
         from_attributes = True
 
 
+class EstadisticaSede(BaseModel):
+    """Estadísticas de un equipo como local o como visitante."""
+    partidos_jugados: int = 0
+    victorias: int = 0
+    empates: int = 0
+    derrotas: int = 0
+    goles_favor: int = 0
+    goles_contra: int = 0
+
+
 class EstadisticaEquipoDetalleResponse(BaseModel):
-    """Esquema de respuesta enriquecido."""
+    """
+    Esquema de respuesta enriquecido.
+    Se proyecta desde Posicion, que guarda ganados/empatados/perdidos.
+    """
     id: int
     goles_favor: int
     goles_contra: int
     partidos_jugados: int
-    victorias: int
-    empates: int
-    derrotas: int
+    victorias: int = Field(
+        validation_alias=AliasChoices("victorias", "ganados"))
+    empates: int = Field(
+        validation_alias=AliasChoices("empates", "empatados"))
+    derrotas: int = Field(
+        validation_alias=AliasChoices("derrotas", "perdidos"))
     puntos: int
+    local: Optional[EstadisticaSede] = Field(
+        None, validation_alias=AliasChoices("local", "estadistica_local"))
+    visitante: Optional[EstadisticaSede] = Field(
+        None,
+        validation_alias=AliasChoices("visitante", "estadistica_visitante"))
+    forma: Optional[str] = Field(
+        None, description="Últimos resultados, el más reciente al final")
     equipo: EquipoResumen
     campeonato: CampeonatoResumen
     created_at: datetime
@@ -1,6 +1,6 @@
 """Schemas de EstadisticaJugador."""
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -45,6 +45,8 @@ class EstadisticaJugadorBase(BaseModel):
     tarjetas_amarillas: Optional[int] = Field(default=0, ge=0)
     tarjetas_rojas: Optional[int] = Field(default=0, ge=0)
     partidos_jugados: Optional[int] = Field(default=0, ge=0)
+    minutos_jugados: Optional[int] = Field(default=0, ge=0)
+    suspensiones: Optional[int] = Field(default=0, ge=0)
 
 
 class EstadisticaJugadorCreate(EstadisticaJugadorBase):
@@ -58,6 +60,8 @@ class EstadisticaJugadorUpdate(BaseModel):
     tarjetas_amarillas: Optional[int] = Field(None, ge=0)
     tarjetas_rojas: Optional[int] = Field(None, ge=0)
     partidos_jugados: Optional[int] = Field(None, ge=0)
+    minutos_jugados: Optional[int] = Field(None, ge=0)
+    suspensiones: Optional[int] = Field(None, ge=0)
 
 
 class EstadisticaJugadorResponse(EstadisticaJugadorBase):
@@ -79,6 +83,8 @@ class EstadisticaJugadorDetalleResponse(BaseModel):
     tarjetas_amarillas: int
     tarjetas_rojas: int
     partidos_jugados: int
+    minutos_jugados: int = 0
+    suspensiones: int = 0
     jugador: JugadorResumen
     equipo: Optional[EquipoResumen] = None
     campeonato: CampeonatoResumen
@@ -88,3 +94,32 @@ class EstadisticaJugadorDetalleResponse(BaseModel):
     class Config:
         """Crear desde atributos de objetos ORM."""
         from_attributes = True
+
+
+class LideresResponse(BaseModel):
+    """Página de una tabla de líderes con cursor a la siguiente."""
+    metrica: str
+    items: List[EstadisticaJugadorDetalleResponse]
+    next_cursor: Optional[str] = None
+
+
+class EstadisticasAcumuladas(BaseModel):
+    """Totales de estadísticas de un jugador."""
+    goles: int = 0
+    asistencias: int = 0
+    tarjetas_amarillas: int = 0
+    tarjetas_rojas: int = 0
+    partidos_jugados: int = 0
+    minutos_jugados: int = 0
+
+
+class CarreraTemporada(EstadisticasAcumuladas):
+    """Estadísticas de un jugador en un campeonato."""
+    campeonato: CampeonatoResumen
+
+
+class CarreraJugadorResponse(BaseModel):
+    """Estadísticas de un jugador por temporada y totales de su carrera."""
+    jugador_id: int
+    temporadas: List[CarreraTemporada]
+    totales: EstadisticasAcumuladas
@@ -1,9 +1,15 @@
 """Schemas de EventoPartido."""
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
-TIPOS_VALIDOS = ["Gol", "TarjetaAmarilla", "TarjetaRoja", "Cambio"]
+TIPOS_VALIDOS = [
+    "Gol",
+    "Autogol",
+    "TarjetaAmarilla",
+    "TarjetaRoja",
+    "Cambio"
+]
 
 
 class JugadorResumen(BaseModel):
@@ -33,18 +39,45 @@ class EventoPartidoBase(BaseModel):
     jugador_id: int
     equipo_id: int
     tipo: str = Field(
-        ..., description="Gol, TarjetaAmarilla, TarjetaRoja, Cambio")
+        ...,
+        description="Gol, Autogol, TarjetaAmarilla, TarjetaRoja, Cambio")
     minuto: Optional[int] = Field(
         None, ge=1, le=120, description="Minuto del evento")
     jugador_sale_id: Optional[int] = Field(
         None, description="Solo requerido cuando tipo es Cambio"
     )
+    asistente_id: Optional[int] = Field(
+        None, description="Jugador que asistió, solo cuando tipo es Gol"
+    )
 
 
 class EventoPartidoCreate(EventoPartidoBase):
     """Esquema para crear un EventoPartido."""
 
 
+class EventoPartidoLoteItem(BaseModel):
+    """Evento de un lote, identificado por un id generado en el cliente."""
+    id_cliente: str = Field(
+        ..., min_length=1, max_length=64,
+        description="Id único del evento generado en el dispositivo")
+    jugador_id: int
+    equipo_id: int
+    tipo: str = Field(
+        ...,
+        description="Gol, Autogol, TarjetaAmarilla, TarjetaRoja, Cambio")
+    minuto: Optional[int] = Field(
+        None, ge=1, le=120, description="Minuto del evento")
+    jugador_sale_id: Optional[int] = None
+    asistente_id: Optional[int] = None
+
+
+class EventoPartidoLote(BaseModel):
+    """Esquema para registrar varios eventos de un partido a la vez."""
+    partido_id: int
+    eventos: List[EventoPartidoLoteItem] = Field(
+        ..., min_length=1, max_length=200)
+
+
 class EventoPartidoUpdate(BaseModel):
     """Esquema para actualizar un EventoPartido."""
     minuto: Optional[int] = Field(None, ge=1, le=120)
@@ -54,6 +87,7 @@ class EventoPartidoUpdate(BaseModel):
 class EventoPartidoResponse(EventoPartidoBase):
     """Esquema de respuesta simple con IDs."""
     id: int
+    id_cliente: Optional[str] = None
     created_at: datetime
 
     class Config:
@@ -61,6 +95,12 @@ class EventoPartidoResponse(EventoPartidoBase):
         from_attributes = True
 
 
+class EventoPartidoLoteResponse(BaseModel):
+    """Resultado de un lote: eventos nuevos e id_cliente ya registrados."""
+    creados: List[EventoPartidoResponse]
+    duplicados: List[str]
+
+
 class EventoPartidoDetalleResponse(BaseModel):
     """Esquema de respuesta enriquecido con nombres."""
     id: int
@@ -70,8 +110,33 @@ class EventoPartidoDetalleResponse(BaseModel):
     created_at: datetime
     jugador: JugadorResumen
     jugador_sale: Optional[JugadorResumen] = None  # Solo para cambios
+    asistente: Optional[JugadorResumen] = None  # Solo para goles
     equipo: EquipoResumen
 
     class Config:
         """Crear desde atributos de objetos ORM."""
         from_attributes = True
+
+
+class EventoLineaTiempo(BaseModel):
+    """Evento de la línea de tiempo con el estado del partido tras él."""
+    id: int
+    minuto: Optional[int]
+    tipo: str
+    equipo_id: int
+    jugador_id: int
+    jugador_sale_id: Optional[int] = None
+    asistente_id: Optional[int] = None
+    goles_local: int
+    goles_visitante: int
+    # Jugadores en cancha del equipo, solo tras un cambio o una expulsión
+    en_cancha: Optional[List[int]] = None
+
+
+class LineaTiempoResponse(BaseModel):
+    """Línea de tiempo de un partido ordenada por minuto."""
+    partido_id: int
+    equipo_local_id: int
+    equipo_visitante_id: int
+    titulares: Dict[int, List[int]]
+    eventos: List[EventoLineaTiempo]
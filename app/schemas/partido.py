@@ -1,6 +1,6 @@
 """Schemas de Partido."""
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 ESTADOS_VALIDOS = ["Programado", "En curso", "Finalizado", "Suspendido"]
@@ -39,8 +39,6 @@ class PartidoBase(BaseModel):
         default="Programado",
         description="Programado, En curso, Finalizado, Suspendido"
     )
-    goles_local: Optional[int] = Field(default=0, ge=0)
-    goles_visitante: Optional[int] = Field(default=0, ge=0)
     observaciones: Optional[str] = Field(None, max_length=1000)
 
 
@@ -54,8 +52,6 @@ class PartidoUpdate(BaseModel):
     lugar: Optional[str] = Field(None, min_length=1, max_length=200)
     estado: Optional[str] = Field(
         None, description="Programado, En curso, Finalizado, Suspendido")
-    goles_local: Optional[int] = Field(None, ge=0)
-    goles_visitante: Optional[int] = Field(None, ge=0)
     observaciones: Optional[str] = Field(None, max_length=1000)
     jornada: Optional[int] = Field(None, ge=1)
 
@@ -63,6 +59,8 @@ class PartidoUpdate(BaseModel):
 class PartidoResponse(PartidoBase):
     """Esquema de respuesta simple con IDs."""
     id: int
+    goles_local: int = 0
+    goles_visitante: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -90,3 +88,30 @@ class PartidoDetalleResponse(BaseModel):
     class Config:
         """Crear desde atributos de objetos ORM."""
         from_attributes = True
+
+
+class MarcadorResponse(BaseModel):
+    """Marcador en vivo, mantenido a partir de los goles registrados."""
+    partido_id: int
+    estado: str
+    goles_local: int
+    goles_visitante: int
+
+
+class FixtureCreate(BaseModel):
+    """Esquema para generar el calendario completo de un campeonato."""
+    campeonato_id: int
+    formato: str = Field(
+        default="todos_contra_todos",
+        description="todos_contra_todos, ida_y_vuelta, series"
+    )
+    equipo_ids: Optional[List[int]] = Field(
+        None, description="Por defecto todos los equipos del campeonato")
+    series: Optional[Dict[str, List[int]]] = Field(
+        None, description="Solo para formato series: nombre -> equipos")
+    doble_vuelta: bool = Field(
+        default=False, description="Solo para formato series")
+    jornada_inicial: int = Field(default=1, ge=1)
+    fecha_inicio: Optional[datetime] = None
+    dias_entre_jornadas: int = Field(default=7, ge=1)
+    lugar: Optional[str] = Field(None, min_length=1, max_length=200)
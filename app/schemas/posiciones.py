@@ -58,6 +58,8 @@ class PosicionUpdate(BaseModel):
 class PosicionResponse(PosicionBase):
     """Esquema de respuesta simple con IDs."""
     id: int
+    diferencia_goles: Optional[int] = None
+    puesto: Optional[int] = None
     created_at: datetime
     updated_at: datetime
 
@@ -77,6 +79,8 @@ class PosicionDetalleResponse(BaseModel):
     goles_favor: int
     goles_contra: int
     puntos: int
+    diferencia_goles: Optional[int] = None
+    puesto: Optional[int] = None
     equipo: EquipoResumen
     campeonato: CampeonatoResumen
     created_at: datetime
@@ -85,3 +89,23 @@ class PosicionDetalleResponse(BaseModel):
     class Config:
         """Crear desde atributos de objetos ORM."""
         from_attributes = True
+
+
+class PosicionJornadaResponse(BaseModel):
+    """Fila de la tabla de posiciones acumulada tras una jornada."""
+    jornada: int
+    puesto: Optional[int]
+    serie: Optional[str]
+    partidos_jugados: int
+    ganados: int
+    empatados: int
+    perdidos: int
+    goles_favor: int
+    goles_contra: int
+    diferencia_goles: Optional[int] = None
+    puntos: int
+    equipo: EquipoResumen
+
+    class Config:
+        """Crear desde atributos de objetos ORM."""
+        from_attributes = True
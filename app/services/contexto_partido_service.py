@@ -0,0 +1,143 @@
+"""
+Contexto de un partido para validar actas y eventos en memoria.
+
+Estado, equipos y convocados se guardan en Redis junto con un número de
+versión. Toda escritura sobre el partido o su acta incrementa la versión
+(INCR), lo que invalida el contexto sin tener que borrarlo; la siguiente
+lectura lo reconstruye desde la base de datos.
+"""
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.redis import get_redis
+from app.models.acta_partido import ActaPartido
+from app.models.partido import Partido
+
+logger = logging.getLogger(__name__)
+
+
+class ContextoPartido(BaseModel):
+    """Datos de un partido necesarios para validar actas y eventos."""
+    id: int
+    version: int
+    estado: str
+    campeonato_id: int
+    jornada: int
+    equipo_local_id: int
+    equipo_visitante_id: int
+    # equipo_id -> jugadores convocados en el acta
+    convocados: Dict[int, List[int]]
+    # Marcador tras un gol; no se guarda en el caché
+    goles_local: Optional[int] = None
+    goles_visitante: Optional[int] = None
+
+    @property
+    def equipos(self) -> Tuple[int, int]:
+        """Equipos que disputan el partido."""
+        return self.equipo_local_id, self.equipo_visitante_id
+
+    def pares_convocados(self) -> Set[Tuple[int, int]]:
+        """Pares (jugador_id, equipo_id) convocados en el acta."""
+        return {
+            (jugador_id, equipo_id)
+            for equipo_id, jugadores in self.convocados.items()
+            for jugador_id in jugadores
+        }
+
+
+def _clave(partido_id: int) -> str:
+    return f"contexto_partido:{partido_id}"
+
+
+def _clave_version(partido_id: int) -> str:
+    return f"contexto_partido:{partido_id}:version"
+
+
+async def _cargar_contexto(
+    db: AsyncSession,
+    partido_id: int,
+    version: int
+) -> ContextoPartido | None:
+    """Construye el contexto desde la base de datos."""
+    partido = (await db.execute(
+        select(
+            Partido.id,
+            Partido.estado,
+            Partido.campeonato_id,
+            Partido.jornada,
+            Partido.equipo_local_id,
+            Partido.equipo_visitante_id
+        ).where(Partido.id == partido_id)
+    )).mappings().one_or_none()
+    if partido is None:
+        return None
+
+    convocados: Dict[int, List[int]] = {
+        partido["equipo_local_id"]: [],
+        partido["equipo_visitante_id"]: []
+    }
+    for jugador_id, equipo_id in (await db.execute(
+        select(ActaPartido.jugador_id, ActaPartido.equipo_id).where(
+            ActaPartido.partido_id == partido_id,
+            ActaPartido.convocado.is_(True)
+        )
+    )).all():
+        convocados.setdefault(equipo_id, []).append(jugador_id)
+
+    return ContextoPartido(
+        **partido, version=version, convocados=convocados)
+
+
+async def obtener_contexto(
+    db: AsyncSession,
+    partido_id: int
+) -> ContextoPartido | None:
+    """
+    Contexto del partido desde Redis (versión y contexto en un solo viaje
+    con pipeline), o desde la base si no está o quedó desactualizado.
+    Devuelve None si el partido no existe.
+    """
+    redis = await get_redis()
+    pipe = redis.pipeline(transaction=False)
+    pipe.get(_clave_version(partido_id))
+    pipe.get(_clave(partido_id))
+    version, guardado = await pipe.execute()
+    version = int(version or 0)
+
+    if guardado:
+        contexto = ContextoPartido.model_validate_json(guardado)
+        if contexto.version == version:
+            return contexto
+
+    contexto = await _cargar_contexto(db, partido_id, version)
+    if contexto is not None:
+        # Si otra escritura incrementó la versión mientras tanto, este
+        # contexto quedará descartado en la próxima lectura
+        await redis.setex(
+            _clave(partido_id),
+            settings.contexto_partido_ttl,
+            contexto.model_dump_json(
+                exclude={"goles_local", "goles_visitante"})
+        )
+    return contexto
+
+
+async def invalidar_contexto(partido_id: int) -> None:
+    """
+    Invalida el contexto tras cambiar el partido o su acta. Corre después
+    del commit, así que un fallo de Redis se registra en vez de responder
+    con error: el contexto viejo vence con su TTL y, mientras tanto, el
+    estado del partido se vuelve a comprobar en la base al escribir.
+    """
+    try:
+        redis = await get_redis()
+        await redis.incr(_clave_version(partido_id))
+    except RedisError:
+        logger.exception(
+            "No se pudo invalidar el contexto del partido %s", partido_id)
@@ -0,0 +1,123 @@
+"""Servicio del índice de elegibilidad (suspensiones) de jugadores."""
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Set
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.elegibilidad_jugador import ElegibilidadJugador
+from app.models.partido import Partido
+
+
+def sancion_vigente(campeonato_id: int, jornada: int):
+    """Condición de una sanción que alcanza a la jornada indicada."""
+    return (
+        (ElegibilidadJugador.campeonato_id == campeonato_id)
+        & (ElegibilidadJugador.jornada_desde <= jornada)
+        & (ElegibilidadJugador.jornada_hasta >= jornada)
+    )
+
+
+async def _cumplimiento_pendiente(
+    db: AsyncSession,
+    partido: Partido,
+    jugador_ids: Iterable[int]
+) -> Dict[int, int]:
+    """
+    Última jornada de suspensión ya registrada por cada jugador en partidos
+    del campeonato jugados hasta la jornada de este partido.
+    """
+    return dict((await db.execute(
+        select(
+            ElegibilidadJugador.jugador_id,
+            func.max(ElegibilidadJugador.jornada_hasta)
+        )
+        .join(Partido, Partido.id == ElegibilidadJugador.partido_id)
+        .where(
+            ElegibilidadJugador.jugador_id.in_(list(jugador_ids)),
+            ElegibilidadJugador.campeonato_id == partido.campeonato_id,
+            ElegibilidadJugador.partido_id != partido.id,
+            Partido.jornada <= partido.jornada
+        )
+        .group_by(ElegibilidadJugador.jugador_id)
+    )).all())
+
+
+async def registrar_sanciones(
+    db: AsyncSession,
+    partido: Partido,
+    sanciones: Dict[int, int],
+    motivos: Dict[int, str]
+) -> None:
+    """
+    Registra con un solo upsert las suspensiones generadas en un partido,
+    una fila por jugador y partido. Cada suspensión cubre una de las
+    jornadas siguientes; si el jugador aún cumple otra, se encadena a
+    continuación. Así, reabrir el partido solo quita lo que él agregó.
+    """
+    if not sanciones:
+        return
+    pendiente = await _cumplimiento_pendiente(db, partido, sanciones)
+    ahora = datetime.now(timezone.utc)
+    filas = []
+    for jugador_id, partidos in sanciones.items():
+        desde = max(partido.jornada, pendiente.get(jugador_id, 0)) + 1
+        filas.append({
+            "jugador_id": jugador_id,
+            "campeonato_id": partido.campeonato_id,
+            "partido_id": partido.id,
+            "jornada_desde": desde,
+            "jornada_hasta": desde + partidos - 1,
+            "motivo": motivos.get(jugador_id),
+            "created_at": ahora,
+            "updated_at": ahora
+        })
+    stmt = insert(ElegibilidadJugador).values(filas)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=["jugador_id", "partido_id"],
+        set_={
+            "jornada_desde": stmt.excluded.jornada_desde,
+            "jornada_hasta": stmt.excluded.jornada_hasta,
+            "motivo": stmt.excluded.motivo,
+            "updated_at": stmt.excluded.updated_at
+        }
+    ))
+
+
+async def anular_sanciones(db: AsyncSession, partido: Partido) -> None:
+    """Elimina las suspensiones originadas en un partido reabierto."""
+    await db.execute(
+        delete(ElegibilidadJugador)
+        .where(ElegibilidadJugador.partido_id == partido.id)
+    )
+
+
+async def jugador_suspendido(
+    db: AsyncSession,
+    jugador_id: int,
+    campeonato_id: int,
+    jornada: int
+) -> bool:
+    """Consulta puntual sobre el índice (jugador, campeonato)."""
+    return (await db.execute(
+        select(ElegibilidadJugador.id).where(
+            ElegibilidadJugador.jugador_id == jugador_id,
+            sancion_vigente(campeonato_id, jornada)
+        )
+    )).first() is not None
+
+
+async def jugadores_suspendidos(
+    db: AsyncSession,
+    jugador_ids: Iterable[int],
+    campeonato_id: int,
+    jornada: int
+) -> Set[int]:
+    """De una lista de jugadores, los suspendidos para la jornada."""
+    return set((await db.execute(
+        select(ElegibilidadJugador.jugador_id).where(
+            ElegibilidadJugador.jugador_id.in_(list(jugador_ids)),
+            sancion_vigente(campeonato_id, jornada)
+        )
+    )).scalars())
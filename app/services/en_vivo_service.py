@@ -0,0 +1,369 @@
+"""
+Servicio de transmisión en vivo de los partidos.
+
+Cada cambio se guarda en un stream de Redis por partido y por campeonato
+(para poder retomar desde Last-Event-ID) y se publica en un único canal.
+Cada proceso mantiene una sola suscripción a ese canal y reparte los
+mensajes a las conexiones locales, en lugar de que cada espectador
+consulte la base de datos.
+"""
+import asyncio
+import re
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable, Dict, List, Set, Tuple
+
+import orjson
+from fastapi import HTTPException, WebSocket, WebSocketDisconnect, status
+
+from app.config import settings
+from app.core.redis import get_redis
+
+CANAL_EN_VIVO = "en_vivo"
+FORMATO_ID = re.compile(r"^\d+-\d+$")
+
+
+def stream_partido(partido_id: int) -> str:
+    """Clave del stream de eventos de un partido."""
+    return f"eventos:partido:{partido_id}"
+
+
+def stream_campeonato(campeonato_id: int) -> str:
+    """Clave del stream de eventos de un campeonato."""
+    return f"eventos:campeonato:{campeonato_id}"
+
+
+def canal_marcador(campeonato_id: int, jornada: int) -> str:
+    """Clave de los marcadores de una jornada (sin stream, solo en vivo)."""
+    return f"marcador:campeonato:{campeonato_id}:jornada:{jornada}"
+
+
+def datos_marcador(partido) -> Dict[str, Any]:
+    """
+    Delta compacto con el estado y el marcador de un partido. Si el
+    marcador no se conoce (p. ej. desde el contexto tras una tarjeta) se
+    omite y el cliente conserva el último recibido.
+    """
+    datos = {"partido_id": partido.id, "estado": partido.estado}
+    if partido.goles_local is not None:
+        datos["goles_local"] = partido.goles_local
+    if partido.goles_visitante is not None:
+        datos["goles_visitante"] = partido.goles_visitante
+    return datos
+
+
+def _orden_id(id_stream: str) -> Tuple[int, int]:
+    """Convierte un id de stream ("ms-secuencia") en una clave ordenable."""
+    milisegundos, secuencia = id_stream.split("-")
+    return int(milisegundos), int(secuencia)
+
+
+async def publicar_evento(
+    tipo: str,
+    partido_id: int,
+    campeonato_id: int,
+    datos: Dict[str, Any]
+) -> None:
+    """
+    Guarda el mensaje en los streams del partido y del campeonato y lo
+    publica para las conexiones abiertas en todos los procesos.
+    """
+    redis = await get_redis()
+    mensaje = orjson.dumps({
+        "tipo": tipo,
+        "partido_id": partido_id,
+        "campeonato_id": campeonato_id,
+        "datos": datos
+    }).decode()
+
+    pipe = redis.pipeline(transaction=False)
+    for clave in (stream_partido(partido_id),
+                  stream_campeonato(campeonato_id)):
+        pipe.xadd(
+            clave, {"m": mensaje},
+            maxlen=settings.en_vivo_maxlen, approximate=True
+        )
+    id_partido, id_campeonato = await pipe.execute()
+
+    await redis.publish(CANAL_EN_VIVO, orjson.dumps({
+        "ids": {
+            stream_partido(partido_id): id_partido,
+            stream_campeonato(campeonato_id): id_campeonato
+        },
+        "m": mensaje
+    }))
+
+
+async def publicar_marcador(
+    partido,
+    evento: Dict[str, Any] | None = None,
+    jornada_anterior: int | None = None
+) -> None:
+    """
+    Publica el marcador de un partido a los tableros de su jornada (y de la
+    anterior, si el partido se movió de jornada).
+    """
+    datos = datos_marcador(partido)
+    if evento is not None:
+        datos["ultimo_evento"] = evento
+    jornadas = {partido.jornada, jornada_anterior} - {None}
+    redis = await get_redis()
+    await redis.publish(CANAL_EN_VIVO, orjson.dumps({
+        "ids": {
+            canal_marcador(partido.campeonato_id, jornada): None
+            for jornada in jornadas
+        },
+        "m": orjson.dumps(datos).decode()
+    }))
+
+
+class Difusor:
+    """
+    Suscripción única al canal en vivo por proceso. Entrega cada mensaje a
+    los receptores registrados para su stream sin bloquear: un receptor
+    lento nunca detiene al resto.
+    """
+
+    def __init__(self):
+        self.receptores: Dict[str, Set[Callable]] = defaultdict(set)
+        self.tarea: asyncio.Task | None = None
+        # Activo mientras la suscripción al canal está confirmada
+        self.listo = asyncio.Event()
+
+    def iniciar(self) -> None:
+        """Inicia la suscripción del proceso si no está en marcha."""
+        if self.tarea is None or self.tarea.done():
+            self.tarea = asyncio.create_task(self._escuchar())
+
+    def suscribir(self, clave: str, receptor: Callable) -> None:
+        """Registra un receptor(id_stream, mensaje) para un stream."""
+        self.receptores[clave].add(receptor)
+        self.iniciar()
+
+    async def esperar_suscripcion(self) -> None:
+        """
+        Espera, con un límite, a que el canal esté suscrito: lo publicado
+        antes de ese momento solo se recupera leyendo el stream.
+        """
+        try:
+            await asyncio.wait_for(
+                self.listo.wait(), timeout=settings.en_vivo_keepalive)
+        except asyncio.TimeoutError:
+            pass
+
+    def desuscribir(self, clave: str, receptor: Callable) -> None:
+        """Quita un receptor; el stream se olvida si no quedan receptores."""
+        receptores = self.receptores.get(clave)
+        if receptores is None:
+            return
+        receptores.discard(receptor)
+        if not receptores:
+            del self.receptores[clave]
+
+    async def _escuchar(self) -> None:
+        """Lee el canal y reparte; ante un error de Redis se reconecta."""
+        while True:
+            try:
+                redis = await get_redis()
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(CANAL_EN_VIVO)
+                    self.listo.set()
+                    async for aviso in pubsub.listen():
+                        if aviso["type"] == "message":
+                            self._repartir(orjson.loads(aviso["data"]))
+            except Exception:  # pylint: disable=broad-except
+                await asyncio.sleep(1)
+            finally:
+                self.listo.clear()
+
+    def _repartir(self, aviso: Dict[str, Any]) -> None:
+        """Entrega el mensaje a los receptores de cada stream afectado."""
+        mensaje = orjson.loads(aviso["m"])
+        for clave, id_stream in aviso["ids"].items():
+            for receptor in list(self.receptores.get(clave, ())):
+                receptor(id_stream, mensaje)
+
+    async def cerrar(self) -> None:
+        """Detiene la suscripción del proceso."""
+        if self.tarea is not None:
+            self.tarea.cancel()
+            try:
+                await self.tarea
+            except asyncio.CancelledError:
+                pass
+            self.tarea = None
+
+
+difusor = Difusor()
+
+
+class ColaEventos:
+    """
+    Cola acotada de una conexión SSE. Si se llena, se vacía y se marca
+    como desbordada: la conexión recupera lo perdido desde el stream.
+    """
+
+    def __init__(self):
+        self.cola: asyncio.Queue = asyncio.Queue(settings.en_vivo_cola)
+        self.desbordada = False
+
+    def __call__(self, id_stream: str, mensaje: Dict[str, Any]) -> None:
+        if self.desbordada:
+            return
+        try:
+            self.cola.put_nowait((id_stream, mensaje))
+        except asyncio.QueueFull:
+            while not self.cola.empty():
+                self.cola.get_nowait()
+            self.desbordada = True
+            self.cola.put_nowait(None)
+
+
+def validar_ultimo_id(ultimo_id: str | None) -> str | None:
+    """Valida el encabezado Last-Event-ID enviado al reconectar."""
+    if ultimo_id and not FORMATO_ID.match(ultimo_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Last-Event-ID inválido"
+        )
+    return ultimo_id or None
+
+
+async def _pendientes(
+    clave: str,
+    ultimo_id: str
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Mensajes del stream posteriores a ultimo_id."""
+    redis = await get_redis()
+    entradas = await redis.xrange(
+        clave, min=f"({ultimo_id}", max="+", count=settings.en_vivo_maxlen)
+    return [(id_stream, orjson.loads(campos["m"]))
+            for id_stream, campos in entradas]
+
+
+async def _ultimo_id(clave: str) -> Tuple[int, int]:
+    """Id del último mensaje guardado en el stream."""
+    redis = await get_redis()
+    entradas = await redis.xrevrange(clave, count=1)
+    return _orden_id(entradas[0][0]) if entradas else (0, 0)
+
+
+def _formato_sse(id_stream: str, mensaje: Dict[str, Any]) -> str:
+    """Serializa un mensaje con el formato de Server-Sent Events."""
+    datos = orjson.dumps(mensaje).decode()
+    return f"id: {id_stream}\nevent: {mensaje['tipo']}\ndata: {datos}\n\n"
+
+
+async def transmitir_eventos(
+    clave: str,
+    ultimo_id: str | None,
+    desconectado: Callable
+) -> AsyncIterator[str]:
+    """
+    Generador SSE de un stream. Fija el punto de partida antes de
+    suscribirse y, ya suscrito, lee el stream desde ahí: lo publicado
+    entre medio llega por el stream y lo repetido se descarta por su id.
+    """
+    if ultimo_id:
+        desde = ultimo_id
+    else:
+        # Conexión nueva: solo interesa lo que llegue desde ahora
+        milisegundos, secuencia = await _ultimo_id(clave)
+        desde = f"{milisegundos}-{secuencia}"
+    receptor = ColaEventos()
+    difusor.suscribir(clave, receptor)
+    try:
+        await difusor.esperar_suscripcion()
+        enviado = _orden_id(desde)
+        pendientes = await _pendientes(clave, desde)
+        while True:
+            for id_stream, mensaje in pendientes:
+                if _orden_id(id_stream) > enviado:
+                    enviado = _orden_id(id_stream)
+                    yield _formato_sse(id_stream, mensaje)
+            pendientes = []
+
+            try:
+                item = await asyncio.wait_for(
+                    receptor.cola.get(), timeout=settings.en_vivo_keepalive)
+            except asyncio.TimeoutError:
+                if await desconectado():
+                    return
+                yield ": ping\n\n"
+                continue
+
+            if item is None:
+                # La conexión se atrasó: se recupera desde el stream
+                receptor.desbordada = False
+                pendientes = await _pendientes(
+                    clave, f"{enviado[0]}-{enviado[1]}")
+            else:
+                pendientes = [item]
+    finally:
+        difusor.desuscribir(clave, receptor)
+
+
+class ColaMarcador:
+    """
+    Pendientes de una conexión del tablero, fusionados por partido: si el
+    cliente es lento, solo recibe el último estado de cada partido en vez
+    de acumular mensajes.
+    """
+
+    def __init__(self):
+        self.pendientes: Dict[int, Dict[str, Any]] = {}
+        self.aviso = asyncio.Event()
+
+    def __call__(self, _id_stream, delta: Dict[str, Any]) -> None:
+        anterior = self.pendientes.get(delta["partido_id"], {})
+        self.pendientes[delta["partido_id"]] = {**anterior, **delta}
+        self.aviso.set()
+
+    async def siguiente(self) -> List[Dict[str, Any]]:
+        """Espera cambios y devuelve los pendientes fusionados."""
+        await self.aviso.wait()
+        self.aviso.clear()
+        lote, self.pendientes = list(self.pendientes.values()), {}
+        return lote
+
+
+async def atender_tablero(
+    websocket: WebSocket,
+    receptor: ColaMarcador,
+    inicial: List[Dict[str, Any]]
+) -> None:
+    """
+    Envía el estado inicial y luego los cambios fusionados hasta que el
+    cliente se desconecte. Un cliente que no recibe dentro del tiempo
+    límite se desconecta para no retener memoria ni el difusor.
+    """
+    async def enviar(tipo: str, partidos: List[Dict[str, Any]]) -> None:
+        await asyncio.wait_for(
+            websocket.send_text(orjson.dumps(
+                {"tipo": tipo, "partidos": partidos}).decode()),
+            timeout=settings.en_vivo_timeout_envio
+        )
+
+    async def transmitir() -> None:
+        await enviar("estado", inicial)
+        while True:
+            await enviar("cambios", await receptor.siguiente())
+
+    async def escuchar() -> None:
+        # Solo para detectar el cierre; el cliente no envía mensajes
+        while True:
+            await websocket.receive_text()
+
+    tareas = [
+        asyncio.create_task(transmitir()),
+        asyncio.create_task(escuchar())
+    ]
+    terminadas, pendientes = await asyncio.wait(
+        tareas, return_when=asyncio.FIRST_COMPLETED)
+    for tarea in pendientes:
+        tarea.cancel()
+    for tarea in terminadas:
+        error = tarea.exception()
+        if isinstance(error, asyncio.TimeoutError):
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        elif error and not isinstance(error, WebSocketDisconnect):
+            raise error
@@ -0,0 +1,91 @@
+"""Servicio para generar el calendario (fixture) de un campeonato."""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+# Formatos de calendario soportados
+FORMATOS_FIXTURE = ["todos_contra_todos", "ida_y_vuelta", "series"]
+
+# Lista de jornadas; cada jornada es una lista de (local, visitante)
+Calendario = List[List[Tuple[int, int]]]
+
+
+def todos_contra_todos(equipos: List[int]) -> Calendario:
+    """
+    Calendario de una vuelta por el método del círculo.
+    Con número impar de equipos uno descansa en cada jornada y la
+    localía se alterna para repartirla entre todos.
+    """
+    rotacion: List[Optional[int]] = list(equipos)
+    if len(rotacion) % 2:
+        rotacion.append(None)  # Descanso
+
+    mitad = len(rotacion) // 2
+    jornadas: Calendario = []
+    for numero in range(len(rotacion) - 1):
+        cruces = []
+        for i in range(mitad):
+            local, visitante = rotacion[i], rotacion[-1 - i]
+            if local is None or visitante is None:
+                continue
+            if i == 0 and numero % 2:
+                local, visitante = visitante, local
+            cruces.append((local, visitante))
+        jornadas.append(cruces)
+        # El primero queda fijo y el resto rota una posición
+        rotacion = [rotacion[0], rotacion[-1], *rotacion[1:-1]]
+    return jornadas
+
+
+def ida_y_vuelta(equipos: List[int]) -> Calendario:
+    """Calendario de dos vueltas con la localía invertida en la segunda."""
+    ida = todos_contra_todos(equipos)
+    vuelta = [
+        [(visitante, local) for local, visitante in jornada]
+        for jornada in ida
+    ]
+    return ida + vuelta
+
+
+def por_series(
+    series: Dict[str, List[int]],
+    doble_vuelta: bool = False
+) -> Calendario:
+    """Calendario por grupos: cada serie juega su propio todos contra todos
+    y las jornadas de todas las series se juegan en paralelo."""
+    generador = ida_y_vuelta if doble_vuelta else todos_contra_todos
+    calendarios = [generador(equipos) for equipos in series.values()]
+    total = max((len(c) for c in calendarios), default=0)
+    return [
+        [cruce for c in calendarios if numero < len(c) for cruce in c[numero]]
+        for numero in range(total)
+    ]
+
+
+def filas_partidos(
+    campeonato_id: int,
+    calendario: Calendario,
+    jornada_inicial: int = 1,
+    fecha_inicio: Optional[datetime] = None,
+    dias_entre_jornadas: int = 7,
+    lugar: Optional[str] = None
+) -> List[dict]:
+    """Convierte un calendario en filas listas para un INSERT masivo."""
+    filas = []
+    for indice, jornada in enumerate(calendario):
+        fecha = (
+            fecha_inicio + timedelta(days=dias_entre_jornadas * indice)
+            if fecha_inicio else None
+        )
+        for local, visitante in jornada:
+            filas.append({
+                "campeonato_id": campeonato_id,
+                "equipo_local_id": local,
+                "equipo_visitante_id": visitante,
+                "jornada": jornada_inicial + indice,
+                "fecha_hora": fecha,
+                "lugar": lugar,
+                "estado": "Programado",
+                "goles_local": 0,
+                "goles_visitante": 0,
+            })
+    return filas
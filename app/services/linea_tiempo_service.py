@@ -0,0 +1,122 @@
+"""Servicio de la línea de tiempo (marcador y alineaciones) de un partido."""
+from typing import Any, Dict, List, Set
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.acta_partido import ActaPartido
+from app.models.evento_partido import (
+    TIPOS_GOL,
+    EventoPartido,
+    equipo_del_gol
+)
+from app.models.linea_tiempo_partido import LineaTiempoPartido
+from app.models.partido import Partido
+
+
+async def construir_linea_tiempo(
+    db: AsyncSession,
+    partido: Partido
+) -> Dict[str, Any]:
+    """
+    Recorre los eventos en orden de minuto y arma la línea de tiempo.
+    Cada evento lleva el marcador tras él; los cambios y expulsiones
+    llevan además los jugadores en cancha de su equipo, así el cliente no
+    tiene que reconstruir la alineación.
+    """
+    en_cancha: Dict[int, Set[int]] = {
+        partido.equipo_local_id: set(),
+        partido.equipo_visitante_id: set()
+    }
+    for jugador_id, equipo_id in (await db.execute(
+        select(ActaPartido.jugador_id, ActaPartido.equipo_id).where(
+            ActaPartido.partido_id == partido.id,
+            ActaPartido.convocado.is_(True),
+            ActaPartido.titular.is_(True)
+        )
+    )).all():
+        en_cancha.setdefault(equipo_id, set()).add(jugador_id)
+    titulares = {
+        equipo_id: sorted(jugadores)
+        for equipo_id, jugadores in en_cancha.items()
+    }
+
+    eventos = (await db.execute(
+        select(
+            EventoPartido.id,
+            EventoPartido.minuto,
+            EventoPartido.tipo,
+            EventoPartido.equipo_id,
+            EventoPartido.jugador_id,
+            EventoPartido.jugador_sale_id,
+            EventoPartido.asistente_id
+        )
+        .where(EventoPartido.partido_id == partido.id)
+        .order_by(EventoPartido.minuto.asc().nulls_last(), EventoPartido.id)
+    )).mappings().all()
+
+    goles = {partido.equipo_local_id: 0, partido.equipo_visitante_id: 0}
+    linea: List[Dict[str, Any]] = []
+    for evento in eventos:
+        item = dict(evento)
+        equipo = en_cancha.setdefault(evento["equipo_id"], set())
+        if evento["tipo"] in TIPOS_GOL:
+            anotador = equipo_del_gol(
+                partido, evento["tipo"], evento["equipo_id"])
+            goles[anotador] = goles.get(anotador, 0) + 1
+        elif evento["tipo"] == "Cambio":
+            equipo.discard(evento["jugador_sale_id"])
+            equipo.add(evento["jugador_id"])
+            item["en_cancha"] = sorted(equipo)
+        elif evento["tipo"] == "TarjetaRoja":
+            equipo.discard(evento["jugador_id"])
+            item["en_cancha"] = sorted(equipo)
+        item["goles_local"] = goles[partido.equipo_local_id]
+        item["goles_visitante"] = goles[partido.equipo_visitante_id]
+        linea.append(item)
+
+    return {
+        "partido_id": partido.id,
+        "equipo_local_id": partido.equipo_local_id,
+        "equipo_visitante_id": partido.equipo_visitante_id,
+        "titulares": titulares,
+        "eventos": linea
+    }
+
+
+async def guardar_linea_tiempo(db: AsyncSession, partido: Partido) -> None:
+    """Calcula y guarda la línea de tiempo al finalizar el partido."""
+    contenido = await construir_linea_tiempo(db, partido)
+    stmt = insert(LineaTiempoPartido).values(
+        partido_id=partido.id, contenido=contenido)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=["partido_id"],
+        set_={"contenido": stmt.excluded.contenido}
+    ))
+
+
+async def eliminar_linea_tiempo(db: AsyncSession, partido: Partido) -> None:
+    """Elimina la línea de tiempo guardada de un partido reabierto."""
+    await db.execute(
+        delete(LineaTiempoPartido)
+        .where(LineaTiempoPartido.partido_id == partido.id)
+    )
+
+
+async def obtener_linea_tiempo(
+    db: AsyncSession,
+    partido: Partido
+) -> Dict[str, Any]:
+    """
+    Línea de tiempo guardada de un partido finalizado; en vivo (o si es
+    anterior a este cálculo) se arma en el momento.
+    """
+    if partido.estado == "Finalizado":
+        contenido = (await db.execute(
+            select(LineaTiempoPartido.contenido)
+            .where(LineaTiempoPartido.partido_id == partido.id)
+        )).scalar_one_or_none()
+        if contenido is not None:
+            return contenido
+    return await construir_linea_tiempo(db, partido)
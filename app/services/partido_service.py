@@ -1,206 +1,365 @@
 """Servicio para manejar la lógica de negocio de partidos."""
-from sqlalchemy import select
+from collections import Counter, defaultdict
+from typing import Dict
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
 from app.core.redis import get_redis
-from app.core.cache import delete_pattern
+from app.core.cache import invalidar_cache_campeonato
 
 from app.models.partido import Partido
 from app.models.acta_partido import ActaPartido
 from app.models.evento_partido import EventoPartido
 from app.models.posicion import Posicion
 from app.models.estadistica_jugador import EstadisticaJugador
-from app.models.estadistica_equipo import EstadisticaEquipo
+from app.services.elegibilidad_service import (
+    anular_sanciones,
+    registrar_sanciones
+)
+from app.services.linea_tiempo_service import (
+    eliminar_linea_tiempo,
+    guardar_linea_tiempo
+)
+from app.services.posiciones_service import (
+    PUNTOS_EMPATE,
+    PUNTOS_VICTORIA,
+    actualizar_instantaneas,
+    recalcular_puestos
+)
 
+# Campo de EstadisticaJugador que incrementa cada tipo de evento; el
+# autogol no suma goles al jugador que lo marca
+CAMPOS_EVENTO = {
+    "Gol": "goles",
+    "TarjetaAmarilla": "tarjetas_amarillas",
+    "TarjetaRoja": "tarjetas_rojas",
+}
 
-async def _get_or_create_estadistica_jugador(
-    db: AsyncSession,
-    jugador_id: int,
-    campeonato_id: int
-) -> EstadisticaJugador:
-    """Obtiene o crea estadísticas de un jugador en un campeonato."""
-    estadistica = (await db.execute(
-        select(EstadisticaJugador).where(
-            EstadisticaJugador.jugador_id == jugador_id,
-            EstadisticaJugador.campeonato_id == campeonato_id
-        )
-    )).scalar_one_or_none()
+# Contadores de Posicion que además se desglosan por local y visitante
+CAMPOS_SEDE = (
+    "ganados",
+    "empatados",
+    "perdidos",
+    "goles_favor",
+    "goles_contra"
+)
+
+
+def _letra_resultado(propios: int, rivales: int) -> str:
+    """Resultado de un partido para la forma: G, E o P."""
+    if propios > rivales:
+        return "G"
+    if propios < rivales:
+        return "P"
+    return "E"
 
-    if not estadistica:
-        estadistica = EstadisticaJugador(
-            jugador_id=jugador_id,
-            campeonato_id=campeonato_id
-        )
-        db.add(estadistica)
-        await db.flush()  # Para obtener el id sin hacer commit
 
-    return estadistica
+def _deltas_equipos(partido: Partido) -> Dict[int, Counter]:
+    """Calcula el aporte de un partido a los agregados de cada equipo."""
+    goles_local = partido.goles_local or 0
+    goles_visitante = partido.goles_visitante or 0
+
+    local = Counter(partidos_jugados=1,
+                    goles_favor=goles_local,
+                    goles_contra=goles_visitante)
+    visitante = Counter(partidos_jugados=1,
+                        goles_favor=goles_visitante,
+                        goles_contra=goles_local)
+
+    if goles_local > goles_visitante:
+        local.update(ganados=1, puntos=PUNTOS_VICTORIA)
+        visitante.update(perdidos=1)
+    elif goles_local < goles_visitante:
+        visitante.update(ganados=1, puntos=PUNTOS_VICTORIA)
+        local.update(perdidos=1)
+    else:
+        local.update(empatados=1, puntos=PUNTOS_EMPATE)
+        visitante.update(empatados=1, puntos=PUNTOS_EMPATE)
 
+    for contador, sede in ((local, "local"), (visitante, "visitante")):
+        contador.update({
+            f"{campo}_{sede}": contador[campo] for campo in CAMPOS_SEDE
+        })
 
-async def _get_or_create_estadistica_equipo(
+    return {
+        partido.equipo_local_id: local,
+        partido.equipo_visitante_id: visitante
+    }
+
+
+async def _deltas_jugadores(
     db: AsyncSession,
-    equipo_id: int,
-    campeonato_id: int
-) -> EstadisticaEquipo:
-    """Obtiene o crea estadísticas de un equipo en un campeonato."""
-    estadistica = (await db.execute(
-        select(EstadisticaEquipo).where(
-            EstadisticaEquipo.equipo_id == equipo_id,
-            EstadisticaEquipo.campeonato_id == campeonato_id
+    partido: Partido
+) -> Dict[int, Counter]:
+    """
+    Calcula el aporte de un partido a las estadísticas de sus jugadores.
+    Con el acta y los eventos cargados una sola vez se obtienen conteos,
+    asistencias y minutos jugados en la misma pasada.
+    """
+    deltas: Dict[int, Counter] = defaultdict(Counter)
+
+    # Jugadores del acta que estuvieron convocados
+    convocados = (await db.execute(
+        select(ActaPartido.jugador_id, ActaPartido.titular).where(
+            ActaPartido.partido_id == partido.id,
+            ActaPartido.convocado.is_(True)
         )
-    )).scalar_one_or_none()
+    )).all()
+    entrada: Dict[int, int] = {}
+    for jugador_id, titular in convocados:
+        deltas[jugador_id]["partidos_jugados"] += 1
+        if titular:
+            entrada[jugador_id] = 0
 
-    if not estadistica:
-        estadistica = EstadisticaEquipo(
-            equipo_id=equipo_id,
-            campeonato_id=campeonato_id
+    eventos = (await db.execute(
+        select(
+            EventoPartido.jugador_id,
+            EventoPartido.tipo,
+            EventoPartido.minuto,
+            EventoPartido.jugador_sale_id,
+            EventoPartido.asistente_id
         )
-        db.add(estadistica)
-        await db.flush()
+        .where(EventoPartido.partido_id == partido.id)
+        .order_by(EventoPartido.minuto.asc().nulls_last(), EventoPartido.id)
+    )).all()
 
-    return estadistica
+    # Sin minuto registrado se asume el final del partido
+    fin = max(
+        [settings.duracion_partido] + [e.minuto for e in eventos if e.minuto]
+    )
+    salida: Dict[int, int] = {}
+    for evento in eventos:
+        minuto = evento.minuto or fin
+        campo = CAMPOS_EVENTO.get(evento.tipo)
+        if campo:
+            deltas[evento.jugador_id][campo] += 1
+        if evento.tipo == "Gol" and evento.asistente_id:
+            deltas[evento.asistente_id]["asistencias"] += 1
+        elif evento.tipo == "TarjetaRoja":
+            salida.setdefault(evento.jugador_id, minuto)
+        elif evento.tipo == "Cambio":
+            entrada.setdefault(evento.jugador_id, minuto)
+            if evento.jugador_sale_id:
+                salida.setdefault(evento.jugador_sale_id, minuto)
 
+    for jugador_id, desde in entrada.items():
+        minutos = max(salida.get(jugador_id, fin) - desde, 0)
+        if minutos:
+            deltas[jugador_id]["minutos_jugados"] += minutos
 
-async def _get_or_create_posicion(
+    return deltas
+
+
+async def _aplicar_deltas(
     db: AsyncSession,
-    equipo_id: int,
-    campeonato_id: int
-) -> Posicion:
-    """Obtiene o crea la posición de un equipo en un campeonato."""
-    posicion = (await db.execute(
-        select(Posicion).where(
-            Posicion.equipo_id == equipo_id,
-            Posicion.campeonato_id == campeonato_id
-        )
-    )).scalar_one_or_none()
+    modelo,
+    clave: str,
+    campeonato_id: int,
+    deltas: Dict[int, Counter],
+    signo: int
+) -> Dict[int, object]:
+    """
+    Suma (signo=1) o resta (signo=-1) los deltas sobre las filas agregadas
+    de un campeonato, creando las que falten con una sola consulta previa.
+    Devuelve las filas afectadas indexadas por la clave.
+    """
+    if not deltas:
+        return {}
 
-    if not posicion:
-        posicion = Posicion(
-            equipo_id=equipo_id,
-            campeonato_id=campeonato_id
-        )
-        db.add(posicion)
-        await db.flush()
+    columna = getattr(modelo, clave)
+    filas = {
+        getattr(fila, clave): fila
+        for fila in (await db.execute(
+            select(modelo).where(
+                modelo.campeonato_id == campeonato_id,
+                columna.in_(list(deltas))
+            )
+        )).scalars()
+    }
 
-    return posicion
+    for id_, campos in deltas.items():
+        fila = filas.get(id_)
+        if fila is None:
+            fila = modelo(campeonato_id=campeonato_id, **{clave: id_})
+            db.add(fila)
+            filas[id_] = fila
+        for campo, valor in campos.items():
+            setattr(fila, campo, (getattr(fila, campo) or 0) + signo * valor)
 
+    return filas
 
-async def finalizar_partido(
+
+async def _actualizar_forma(
     db: AsyncSession,
-    partido: Partido
+    partido: Partido,
+    posiciones: Dict[int, Posicion]
 ) -> None:
     """
-    Lógica completa al finalizar un partido.
-    Actualiza estadísticas de jugadores, equipos y tabla de posiciones.
+    Reconstruye la forma de cada equipo con sus últimos partidos
+    finalizados, en el mismo orden (jornada e id) al finalizar y al
+    reabrir. El estado del partido ya está cambiado en la sesión, así que
+    la consulta lo incluye o lo excluye según corresponda.
     """
-    campeonato_id = partido.campeonato_id
-    equipo_local_id = partido.equipo_local_id
-    equipo_visitante_id = partido.equipo_visitante_id
-    goles_local = partido.goles_local
-    goles_visitante = partido.goles_visitante
-
-    # ── 1. Actualizar estadísticas de jugadores ──────────────────────────
-    # Obtener jugadores del acta que estuvieron convocados
-    actas = (await db.execute(
-        select(ActaPartido).where(
-            ActaPartido.partido_id == partido.id,
-            ActaPartido.convocado.is_(True)
+    tamano = settings.partidos_forma
+    for equipo_id, fila in posiciones.items():
+        ultimos = (await db.execute(
+            select(
+                Partido.equipo_local_id,
+                Partido.goles_local,
+                Partido.goles_visitante
+            )
+            .where(
+                Partido.campeonato_id == partido.campeonato_id,
+                Partido.estado == "Finalizado",
+                or_(
+                    Partido.equipo_local_id == equipo_id,
+                    Partido.equipo_visitante_id == equipo_id
+                )
+            )
+            .order_by(Partido.jornada.desc(), Partido.id.desc())
+            .limit(tamano)
+        )).all()
+        fila.forma = "".join(
+            _letra_resultado(gl or 0, gv or 0) if local == equipo_id
+            else _letra_resultado(gv or 0, gl or 0)
+            for local, gl, gv in reversed(ultimos)
         )
-    )).scalars().all()
 
-    for acta in actas:
-        est = await _get_or_create_estadistica_jugador(
-            db, acta.jugador_id, campeonato_id
-        )
-        est.partidos_jugados += 1
 
-    # Obtener todos los eventos del partido
-    eventos = (await db.execute(
-        select(EventoPartido).where(EventoPartido.partido_id == partido.id)
-    )).scalars().all()
+async def _aplicar_partido(
+    db: AsyncSession,
+    partido: Partido,
+    signo: int
+) -> None:
+    """Aplica o revierte el aporte de un partido en todos los agregados."""
+    campeonato_id = partido.campeonato_id
 
-    for evento in eventos:
-        est = await _get_or_create_estadistica_jugador(
-            db, evento.jugador_id, campeonato_id
+    # ── 1. Estadísticas de jugadores ─────────────────────────────────────
+    deltas_jugadores = await _deltas_jugadores(db, partido)
+    estadisticas = await _aplicar_deltas(
+        db, EstadisticaJugador, "jugador_id", campeonato_id,
+        deltas_jugadores, signo
+    )
+    sanciones: Dict[int, int] = {}
+    for jugador_id, est in estadisticas.items():
+        antes = est.suspensiones or 0
+        est.suspensiones = (
+            (est.tarjetas_rojas or 0)
+            + (est.tarjetas_amarillas or 0)
+            // settings.amarillas_por_suspension
         )
-        if evento.tipo == "Gol":
-            est.goles += 1
-        elif evento.tipo == "TarjetaAmarilla":
-            est.tarjetas_amarillas += 1
-        elif evento.tipo == "TarjetaRoja":
-            est.tarjetas_rojas += 1
+        if est.suspensiones > antes:
+            sanciones[jugador_id] = est.suspensiones - antes
 
-    # ── 2. Actualizar estadísticas de equipos ────────────────────────────
-    est_local = await _get_or_create_estadistica_equipo(
-        db, equipo_local_id, campeonato_id
-    )
-    est_visitante = await _get_or_create_estadistica_equipo(
-        db, equipo_visitante_id, campeonato_id
-    )
+    # ── 1b. Índice de elegibilidad para las próximas actas ───────────────
+    if signo > 0:
+        await registrar_sanciones(db, partido, sanciones, {
+            jugador_id: (
+                "TarjetaRoja"
+                if deltas_jugadores[jugador_id]["tarjetas_rojas"]
+                else "Amarillas"
+            )
+            for jugador_id in sanciones
+        })
+    else:
+        await anular_sanciones(db, partido)
 
-    est_local.partidos_jugados += 1
-    est_local.goles_favor += goles_local
-    est_local.goles_contra += goles_visitante
+    # ── 2. Agregado de equipos (posiciones y estadísticas de equipos) ───
+    deltas_equipos = _deltas_equipos(partido)
+    posiciones = await _aplicar_deltas(
+        db, Posicion, "equipo_id", campeonato_id, deltas_equipos, signo
+    )
+    await _actualizar_forma(db, partido, posiciones)
 
-    est_visitante.partidos_jugados += 1
-    est_visitante.goles_favor += goles_visitante
-    est_visitante.goles_contra += goles_local
+    # ── 3. Puestos materializados de la tabla ────────────────────────────
+    await recalcular_puestos(db, campeonato_id)
 
-    if goles_local > goles_visitante:
-        est_local.victorias += 1
-        est_local.puntos += 3
-        est_visitante.derrotas += 1
-    elif goles_local < goles_visitante:
-        est_visitante.victorias += 1
-        est_visitante.puntos += 3
-        est_local.derrotas += 1
-    else:
-        est_local.empates += 1
-        est_local.puntos += 1
-        est_visitante.empates += 1
-        est_visitante.puntos += 1
+    # ── 4. Tabla acumulada por jornada ───────────────────────────────────
+    await actualizar_instantaneas(db, partido, deltas_equipos, signo)
 
-    # ── 3. Actualizar tabla de posiciones ────────────────────────────────
-    pos_local = await _get_or_create_posicion(
-        db, equipo_local_id, campeonato_id)
-    pos_visitante = await _get_or_create_posicion(
-        db, equipo_visitante_id, campeonato_id)
 
-    pos_local.partidos_jugados += 1
-    pos_local.goles_favor += goles_local
-    pos_local.goles_contra += goles_visitante
+def _partido_no_en_curso() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="El partido no está en curso"
+    )
 
-    pos_visitante.partidos_jugados += 1
-    pos_visitante.goles_favor += goles_visitante
-    pos_visitante.goles_contra += goles_local
 
-    if goles_local > goles_visitante:
-        pos_local.ganados += 1
-        pos_local.puntos += 3
-        pos_visitante.perdidos += 1
-    elif goles_local < goles_visitante:
-        pos_visitante.ganados += 1
-        pos_visitante.puntos += 3
-        pos_local.perdidos += 1
-    else:
-        pos_local.empatados += 1
-        pos_local.puntos += 1
-        pos_visitante.empatados += 1
-        pos_visitante.puntos += 1
+async def verificar_en_curso(db: AsyncSession, partido_id: int) -> None:
+    """
+    Comprueba en la base (no en el contexto en caché) que el partido está
+    en curso y bloquea su fila en modo compartido hasta el commit, para
+    que no se finalice mientras se escribe un evento sin goles.
+    """
+    if (await db.execute(
+        select(Partido.id)
+        .where(Partido.id == partido_id, Partido.estado == "En curso")
+        .with_for_update(read=True)
+    )).first() is None:
+        raise _partido_no_en_curso()
 
-    await db.commit()
 
-    redis = await get_redis()
-    await delete_pattern(
-        redis,
-        f"posiciones:campeonato:{partido.campeonato_id}*"
+async def actualizar_marcador(
+    db: AsyncSession,
+    partido,
+    equipo_id: int,
+    goles: int
+) -> None:
+    """
+    Suma (o resta) goles al marcador del equipo en la transacción del
+    evento. El UPDATE es atómico, así dos goles simultáneos no se pisan, y
+    el marcador resultante se copia en el partido (o su contexto). Solo
+    afecta a un partido en curso según la base; si no, responde 409.
+    """
+    columna = (
+        Partido.goles_local if equipo_id == partido.equipo_local_id
+        else Partido.goles_visitante
     )
+    marcador = (await db.execute(
+        update(Partido)
+        .where(Partido.id == partido.id, Partido.estado == "En curso")
+        .values({
+            columna: func.greatest(func.coalesce(columna, 0) + goles, 0)
+        })
+        .returning(Partido.goles_local, Partido.goles_visitante)
+        .execution_options(synchronize_session=False)
+    )).one_or_none()
+    if marcador is None:
+        raise _partido_no_en_curso()
+    partido.goles_local, partido.goles_visitante = marcador
 
-    await delete_pattern(
-        redis,
-        f"estadisticas_jugadores:campeonato:{partido.campeonato_id}*"
-    )
 
-    await delete_pattern(
-        redis,
-        f"estadisticas_equipos:campeonato:{partido.campeonato_id}*"
-    )
+async def finalizar_partido(
+    db: AsyncSession,
+    partido: Partido
+) -> None:
+    """
+    Lógica completa al finalizar un partido.
+    Actualiza estadísticas de jugadores, equipos y tabla de posiciones, y
+    guarda su línea de tiempo.
+    """
+    await _aplicar_partido(db, partido, 1)
+    await guardar_linea_tiempo(db, partido)
+    await db.commit()
+    await invalidar_cache_campeonato(
+        await get_redis(), partido.campeonato_id)
+
+
+async def reabrir_partido(
+    db: AsyncSession,
+    partido: Partido
+) -> None:
+    """
+    Reabre un partido finalizado para poder corregirlo.
+    Resta exactamente su aporte a jugadores, equipos y tabla de posiciones
+    en la misma transacción que devuelve el partido a "En curso".
+    """
+    # El estado cambia antes para que el desempate ya no cuente el partido
+    partido.estado = "En curso"
+    await _aplicar_partido(db, partido, -1)
+    await eliminar_linea_tiempo(db, partido)
+    await db.commit()
+    await invalidar_cache_campeonato(
+        await get_redis(), partido.campeonato_id)
@@ -0,0 +1,314 @@
+"""Servicio para ordenar y materializar la tabla de posiciones."""
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.campeonato import (
+    Campeonato,
+    CRITERIOS_DESEMPATE_DEFECTO,
+    CRITERIOS_DESEMPATE_VALIDOS
+)
+from app.models.partido import Partido
+from app.models.posicion import Posicion
+from app.models.posicion_jornada import PosicionJornada
+
+PUNTOS_VICTORIA = 3
+PUNTOS_EMPATE = 1
+
+# (equipo_local_id, equipo_visitante_id, goles_local, goles_visitante)
+Resultado = Tuple[int, int, int, int]
+
+
+def parsear_criterios(criterios: str | None) -> List[str]:
+    """Convierte la cadena de criterios del campeonato en una lista."""
+    texto = criterios if criterios is not None else CRITERIOS_DESEMPATE_DEFECTO
+    return [c.strip() for c in texto.split(",") if c.strip()]
+
+
+def criterios_invalidos(criterios: str | None) -> List[str]:
+    """Devuelve los criterios que no están soportados."""
+    return [
+        c for c in parsear_criterios(criterios)
+        if c not in CRITERIOS_DESEMPATE_VALIDOS
+    ]
+
+
+def _puntos_directos(
+    equipos: set,
+    resultados: Iterable[Resultado]
+) -> Dict[int, int]:
+    """Puntos obtenidos solo en partidos entre los equipos indicados."""
+    puntos: Dict[int, int] = defaultdict(int)
+    for local, visitante, goles_local, goles_visitante in resultados:
+        if local not in equipos or visitante not in equipos:
+            continue
+        if goles_local > goles_visitante:
+            puntos[local] += PUNTOS_VICTORIA
+        elif goles_local < goles_visitante:
+            puntos[visitante] += PUNTOS_VICTORIA
+        else:
+            puntos[local] += PUNTOS_EMPATE
+            puntos[visitante] += PUNTOS_EMPATE
+    return puntos
+
+
+def ordenar_tabla(
+    filas: Sequence,
+    criterios: List[str],
+    resultados: Sequence[Resultado] = ()
+) -> List:
+    """
+    Ordena filas de posiciones por puntos y criterios de desempate.
+    El enfrentamiento directo se evalúa entre los equipos que siguen
+    empatados en puntos y en los criterios previos; el id del equipo
+    garantiza un orden estable.
+    """
+    directos: Dict[int, int] = {}
+
+    def valores(fila) -> Dict[str, int]:
+        goles_favor = fila.goles_favor or 0
+        return {
+            "diferencia_goles": goles_favor - (fila.goles_contra or 0),
+            "goles_favor": goles_favor,
+            "ganados": fila.ganados or 0,
+            "enfrentamiento_directo": directos.get(fila.equipo_id, 0),
+        }
+
+    def clave(fila, usados: List[str]) -> Tuple[int, ...]:
+        datos = valores(fila)
+        return (
+            -(fila.puntos or 0),
+            *(-datos[c] for c in usados if c in datos)
+        )
+
+    if "enfrentamiento_directo" in criterios:
+        previos = criterios[:criterios.index("enfrentamiento_directo")]
+        grupos: Dict[Tuple[int, ...], set] = defaultdict(set)
+        for fila in filas:
+            grupos[clave(fila, previos)].add(fila.equipo_id)
+        for equipos in grupos.values():
+            if len(equipos) > 1:
+                directos.update(_puntos_directos(equipos, resultados))
+
+    return sorted(
+        filas, key=lambda fila: (*clave(fila, criterios), fila.equipo_id))
+
+
+async def resultados_finalizados(
+    db: AsyncSession,
+    campeonato_id: int,
+    hasta_jornada: int | None = None
+) -> List[Resultado]:
+    """Resultados de los partidos finalizados de un campeonato."""
+    query = select(
+        Partido.equipo_local_id,
+        Partido.equipo_visitante_id,
+        Partido.goles_local,
+        Partido.goles_visitante
+    ).where(
+        Partido.campeonato_id == campeonato_id,
+        Partido.estado == "Finalizado"
+    )
+    if hasta_jornada is not None:
+        query = query.where(Partido.jornada <= hasta_jornada)
+    return [
+        (local, visitante, goles_local or 0, goles_visitante or 0)
+        for local, visitante, goles_local, goles_visitante
+        in (await db.execute(query)).all()
+    ]
+
+
+async def criterios_campeonato(
+    db: AsyncSession,
+    campeonato_id: int
+) -> List[str]:
+    """Criterios de desempate configurados para un campeonato."""
+    criterios = (await db.execute(
+        select(Campeonato.criterios_desempate)
+        .where(Campeonato.id == campeonato_id)
+    )).scalar_one_or_none()
+    return parsear_criterios(criterios)
+
+
+def asignar_puestos(
+    filas: Sequence,
+    criterios: List[str],
+    resultados: Sequence[Resultado] = ()
+) -> None:
+    """Asigna el puesto de cada fila, numerando por separado cada serie."""
+    por_serie: Dict[str | None, list] = defaultdict(list)
+    for fila in filas:
+        por_serie[fila.serie].append(fila)
+    for filas_serie in por_serie.values():
+        ordenadas = ordenar_tabla(filas_serie, criterios, resultados)
+        for puesto, fila in enumerate(ordenadas, start=1):
+            if fila.puesto != puesto:
+                fila.puesto = puesto
+
+
+async def recalcular_puestos(
+    db: AsyncSession,
+    campeonato_id: int
+) -> None:
+    """Materializa el puesto de cada equipo en la tabla del campeonato."""
+    filas = (await db.execute(
+        select(Posicion).where(Posicion.campeonato_id == campeonato_id)
+    )).scalars().all()
+    if not filas:
+        return
+
+    criterios = await criterios_campeonato(db, campeonato_id)
+    resultados = []
+    if "enfrentamiento_directo" in criterios:
+        resultados = await resultados_finalizados(db, campeonato_id)
+
+    asignar_puestos(filas, criterios, resultados)
+
+
+# Contadores que se copian de una instantánea a la siguiente
+CAMPOS_ACUMULADOS = (
+    "partidos_jugados",
+    "ganados",
+    "empatados",
+    "perdidos",
+    "goles_favor",
+    "goles_contra",
+    "puntos"
+)
+
+
+async def actualizar_instantaneas(
+    db: AsyncSession,
+    partido: Partido,
+    deltas: Dict[int, Counter],
+    signo: int
+) -> None:
+    """
+    Mantiene de forma incremental la tabla acumulada tras cada jornada.
+
+    El aporte del partido se suma (o resta) en la instantánea de su jornada
+    y en todas las posteriores ya existentes. Si la de su jornada no existe
+    se crea copiando la anterior, así un partido aplazado queda reflejado
+    sin reconstruir el campeonato.
+    """
+    campeonato_id = partido.campeonato_id
+    jornada = partido.jornada
+
+    filas = (await db.execute(
+        select(PosicionJornada).where(
+            PosicionJornada.campeonato_id == campeonato_id,
+            PosicionJornada.jornada >= jornada
+        )
+    )).scalars().all()
+    por_jornada: Dict[int, Dict[int, PosicionJornada]] = defaultdict(dict)
+    for fila in filas:
+        por_jornada[fila.jornada][fila.equipo_id] = fila
+
+    if jornada not in por_jornada and signo > 0:
+        anterior = (await db.execute(
+            select(PosicionJornada).where(
+                PosicionJornada.campeonato_id == campeonato_id,
+                PosicionJornada.jornada == (
+                    select(PosicionJornada.jornada)
+                    .where(
+                        PosicionJornada.campeonato_id == campeonato_id,
+                        PosicionJornada.jornada < jornada
+                    )
+                    .order_by(PosicionJornada.jornada.desc())
+                    .limit(1)
+                    .scalar_subquery()
+                )
+            )
+        )).scalars().all()
+        for fila in anterior:
+            copia = PosicionJornada(
+                campeonato_id=campeonato_id,
+                jornada=jornada,
+                equipo_id=fila.equipo_id,
+                serie=fila.serie,
+                **{c: getattr(fila, c) or 0 for c in CAMPOS_ACUMULADOS}
+            )
+            db.add(copia)
+            por_jornada[jornada][fila.equipo_id] = copia
+
+    series = dict((await db.execute(
+        select(Posicion.equipo_id, Posicion.serie).where(
+            Posicion.campeonato_id == campeonato_id,
+            Posicion.equipo_id.in_(list(deltas))
+        )
+    )).all())
+
+    for numero, equipos in por_jornada.items():
+        for equipo_id, campos in deltas.items():
+            fila = equipos.get(equipo_id)
+            if fila is None:
+                fila = PosicionJornada(
+                    campeonato_id=campeonato_id,
+                    jornada=numero,
+                    equipo_id=equipo_id,
+                    serie=series.get(equipo_id),
+                    **dict.fromkeys(CAMPOS_ACUMULADOS, 0)
+                )
+                db.add(fila)
+                equipos[equipo_id] = fila
+            for campo in CAMPOS_ACUMULADOS:
+                setattr(
+                    fila, campo,
+                    (getattr(fila, campo) or 0) + signo * campos[campo])
+
+    # Reordenar cada instantánea afectada con los resultados de su momento
+    await _reordenar_instantaneas(db, campeonato_id, por_jornada)
+
+
+async def _reordenar_instantaneas(
+    db: AsyncSession,
+    campeonato_id: int,
+    por_jornada: Dict[int, Dict[int, PosicionJornada]]
+) -> None:
+    """
+    Asigna los puestos de cada instantánea con los criterios actuales y
+    los resultados hasta su jornada.
+    """
+    criterios = await criterios_campeonato(db, campeonato_id)
+    resultados: List[Tuple[int, Resultado]] = []
+    if "enfrentamiento_directo" in criterios:
+        resultados = [
+            (numero, (local, visitante, goles_local or 0, goles_visitante or 0))
+            for numero, local, visitante, goles_local, goles_visitante
+            in (await db.execute(
+                select(
+                    Partido.jornada,
+                    Partido.equipo_local_id,
+                    Partido.equipo_visitante_id,
+                    Partido.goles_local,
+                    Partido.goles_visitante
+                ).where(
+                    Partido.campeonato_id == campeonato_id,
+                    Partido.estado == "Finalizado"
+                )
+            )).all()
+        ]
+
+    for numero, equipos in por_jornada.items():
+        asignar_puestos(
+            list(equipos.values()),
+            criterios,
+            [r for j, r in resultados if j <= numero]
+        )
+
+
+async def recalcular_instantaneas(
+    db: AsyncSession,
+    campeonato_id: int
+) -> None:
+    """Reordena todas las instantáneas, p. ej. al cambiar los criterios."""
+    por_jornada: Dict[int, Dict[int, PosicionJornada]] = defaultdict(dict)
+    for fila in (await db.execute(
+        select(PosicionJornada)
+        .where(PosicionJornada.campeonato_id == campeonato_id)
+    )).scalars():
+        por_jornada[fila.jornada][fila.equipo_id] = fila
+    if por_jornada:
+        await _reordenar_instantaneas(db, campeonato_id, por_jornada)
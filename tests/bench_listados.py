@@ -0,0 +1,109 @@
+"""Benchmark: filas/seg de los listados con ORM vs. selección de columnas."""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+root_path = Path(__file__).parent.parent
+sys.path.insert(0, str(root_path))
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
+from app.database import AsyncSessionLocal
+from app.core.responses import anidar, serializar_lista
+from app.models.estadistica_jugador import EstadisticaJugador
+from app.models.partido import Partido
+from app.routers.estadisticas_jugadores import (
+    _build_response,
+    _query_estadisticas_columnas,
+    _query_estadisticas_con_equipo
+)
+from app.routers.partidos import _query_partidos_campos
+from app.schemas.estadisticas_jugador import EstadisticaJugadorDetalleResponse
+from app.schemas.partido import PartidoDetalleResponse
+
+REPETICIONES = 20
+
+
+async def medir(nombre, funcion):
+    """Ejecuta la función varias veces y muestra las filas por segundo."""
+    filas = 0
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        filas += await funcion()
+    duracion = time.perf_counter() - inicio
+    print(f"  {nombre:<12} {filas / duracion:>12,.0f} filas/seg")
+
+
+async def bench_partidos(db):
+    """GET /partidos/ con instancias ORM vs. columnas."""
+    async def orm():
+        partidos = (await db.execute(
+            select(Partido).options(
+                joinedload(Partido.campeonato),
+                joinedload(Partido.equipo_local),
+                joinedload(Partido.equipo_visitante)
+            ).order_by(Partido.jornada, Partido.id)
+        )).scalars().all()
+        datos = [
+            PartidoDetalleResponse.model_validate(p).model_dump_json()
+            for p in partidos
+        ]
+        db.expunge_all()
+        return len(datos)
+
+    async def columnas():
+        filas = (await db.execute(
+            _query_partidos_campos(tuple(PartidoDetalleResponse.model_fields))
+            .order_by(Partido.jornada, Partido.id)
+        )).mappings().all()
+        serializar_lista(
+            PartidoDetalleResponse, (anidar(f) for f in filas))
+        return len(filas)
+
+    print("GET /partidos/")
+    await medir("ORM", orm)
+    await medir("columnas", columnas)
+
+
+async def bench_estadisticas(db):
+    """GET /estadisticas-jugadores/campeonato/{id} con ORM vs. columnas."""
+    campeonato_id = (await db.execute(
+        select(EstadisticaJugador.campeonato_id)
+        .group_by(EstadisticaJugador.campeonato_id)
+        .order_by(func.count(EstadisticaJugador.id).desc())
+        .limit(1)
+    )).scalar_one()
+
+    async def orm():
+        filas = (await db.execute(
+            _query_estadisticas_con_equipo(campeonato_id)
+        )).all()
+        datos = [
+            _build_response(est, equipo).model_dump_json()
+            for est, equipo in filas
+        ]
+        db.expunge_all()
+        return len(datos)
+
+    async def columnas():
+        filas = (await db.execute(
+            _query_estadisticas_columnas(campeonato_id)
+        )).mappings().all()
+        serializar_lista(
+            EstadisticaJugadorDetalleResponse, (anidar(f) for f in filas))
+        return len(filas)
+
+    print(f"GET /estadisticas-jugadores/campeonato/{campeonato_id}")
+    await medir("ORM", orm)
+    await medir("columnas", columnas)
+
+
+async def main():
+    async with AsyncSessionLocal() as db:
+        await bench_partidos(db)
+        await bench_estadisticas(db)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""Benchmark: serialización de la tabla de posiciones más grande."""
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+root_path = Path(__file__).parent.parent
+sys.path.insert(0, str(root_path))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from app.core.responses import adaptador_lista, serializar_lista
+from app.schemas.posiciones import PosicionDetalleResponse
+
+EQUIPOS = 2000
+REPETICIONES = 50
+
+
+def filas_tabla():
+    """Filas sintéticas con la forma de una fila de Posicion."""
+    ahora = datetime.now()
+    return [
+        {
+            "id": i,
+            "serie": "A" if i % 2 else "B",
+            "partidos_jugados": 19,
+            "ganados": i % 19,
+            "empatados": 0,
+            "perdidos": 19 - i % 19,
+            "goles_favor": i % 50,
+            "goles_contra": 25,
+            "puntos": 3 * (i % 19),
+            "diferencia_goles": i % 50 - 25,
+            "puesto": i,
+            "equipo": {"id": i, "nombre": f"Equipo {i}", "logo_url": None},
+            "campeonato": {"id": 1, "nombre": "Campeonato"},
+            "created_at": ahora,
+            "updated_at": ahora,
+        }
+        for i in range(1, EQUIPOS + 1)
+    ]
+
+
+def medir(nombre, funcion):
+    """Ejecuta la función varias veces y muestra el tiempo por respuesta."""
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        cuerpo = funcion()
+    duracion = (time.perf_counter() - inicio) / REPETICIONES
+    print(f"  {nombre:<28} {duracion * 1000:>8.2f} ms  ({len(cuerpo)} bytes)")
+
+
+def main():
+    filas = filas_tabla()
+    adaptador = adaptador_lista(PosicionDetalleResponse)
+
+    def json_estandar():
+        # Camino por defecto de FastAPI: dicts de Python + json.dumps
+        datos = adaptador.dump_python(
+            adaptador.validate_python(filas), mode="json")
+        return JSONResponse(jsonable_encoder(datos)).body
+
+    def orjson_respuesta():
+        datos = adaptador.dump_python(
+            adaptador.validate_python(filas), mode="json")
+        return ORJSONResponse(datos).body
+
+    def pydantic_core():
+        return serializar_lista(PosicionDetalleResponse, filas)
+
+    print(f"Tabla de posiciones con {EQUIPOS} filas")
+    medir("JSONResponse", json_estandar)
+    medir("ORJSONResponse", orjson_respuesta)
+    medir("dump_json (pydantic-core)", pydantic_core)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Regresión: número de consultas de los listados de estadísticas."""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+root_path = Path(__file__).parent.parent
+sys.path.insert(0, str(root_path))
+
+from sqlalchemy import event, func, select
+from app.database import AsyncSessionLocal, engine
+from app.models.estadistica_jugador import EstadisticaJugador
+from app.routers.estadisticas_jugadores import (
+    serializar_estadisticas_campeonato
+)
+
+# Verificación del campeonato + consulta de estadísticas con su equipo
+CONSULTAS_ESPERADAS = 2
+
+
+class ContadorConsultas:
+    """Cuenta las sentencias SQL ejecutadas sobre el engine."""
+
+    def __init__(self):
+        self.total = 0
+
+    def __call__(self, *args, **kwargs):
+        self.total += 1
+
+    def __enter__(self):
+        event.listen(engine.sync_engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine.sync_engine, "before_cursor_execute", self)
+
+
+async def test_listar_estadisticas_jugadores_consultas_constantes():
+    """El listado no debe lanzar una consulta por jugador (N+1)."""
+    async with AsyncSessionLocal() as db:
+        campeonato_id, jugadores = (await db.execute(
+            select(
+                EstadisticaJugador.campeonato_id,
+                func.count(EstadisticaJugador.id)
+            )
+            .group_by(EstadisticaJugador.campeonato_id)
+            .order_by(func.count(EstadisticaJugador.id).desc())
+            .limit(1)
+        )).one()
+
+        with ContadorConsultas() as contador:
+            respuesta = json.loads(await serializar_estadisticas_campeonato(
+                db, campeonato_id))
+
+        print(f"Jugadores: {len(respuesta)} | Consultas: {contador.total}")
+        assert len(respuesta) == jugadores
+        assert contador.total == CONSULTAS_ESPERADAS, (
+            f"Se esperaban {CONSULTAS_ESPERADAS} consultas y se "
+            f"ejecutaron {contador.total}"
+        )
+        print("✅ Número de consultas constante")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_listar_estadisticas_jugadores_consultas_constantes())
@@ -0,0 +1,97 @@
+"""Regresión: reabrir un partido solo anula las sanciones que él generó."""
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+
+root_path = Path(__file__).parent.parent
+sys.path.insert(0, str(root_path))
+
+from app.database import AsyncSessionLocal
+from app.models.acta_partido import ActaPartido
+from app.models.campeonato import Campeonato
+from app.models.equipo import Equipo
+from app.models.evento_partido import EventoPartido
+from app.models.partido import Partido
+from app.models.usuario import Usuario
+from app.services.elegibilidad_service import jugador_suspendido
+from app.services.partido_service import _aplicar_partido
+
+
+async def _partido_con_roja(db, campeonato, local, visitante, jugador,
+                            jornada):
+    """Partido finalizado en el que el jugador ve una tarjeta roja."""
+    partido = Partido(
+        campeonato_id=campeonato.id,
+        equipo_local_id=local.id,
+        equipo_visitante_id=visitante.id,
+        jornada=jornada,
+        estado="Finalizado",
+        goles_local=0,
+        goles_visitante=0
+    )
+    db.add(partido)
+    await db.flush()
+    db.add_all([
+        ActaPartido(partido_id=partido.id, jugador_id=jugador.id,
+                    equipo_id=local.id, titular=True),
+        EventoPartido(partido_id=partido.id, jugador_id=jugador.id,
+                      equipo_id=local.id, tipo="TarjetaRoja", minuto=30)
+    ])
+    await db.flush()
+    return partido
+
+
+async def test_reabrir_conserva_sanciones_de_otros_partidos():
+    """
+    Finaliza dos partidos con roja para el mismo jugador y reabre el
+    segundo: la suspensión del primero debe seguir vigente. Se usa el
+    mismo paso que finalizar/reabrir sin confirmar la transacción, y al
+    final se descarta todo.
+    """
+    sufijo = uuid.uuid4().hex[:8]
+    async with AsyncSessionLocal() as db:
+        campeonato = Campeonato(nombre=f"Test sanciones {sufijo}")
+        db.add(campeonato)
+        await db.flush()
+        local = Equipo(nombre="Local", campeonato_id=campeonato.id)
+        visitante = Equipo(nombre="Visitante", campeonato_id=campeonato.id)
+        jugador = Usuario(
+            nombres="Jugador", apellidos="Sancionado",
+            cedula=sufijo, username=f"sancion_{sufijo}",
+            password="x", email=f"sancion_{sufijo}@test.com",
+            rol="Jugador"
+        )
+        db.add_all([local, visitante, jugador])
+        await db.flush()
+
+        try:
+            primero = await _partido_con_roja(
+                db, campeonato, local, visitante, jugador, jornada=1)
+            await _aplicar_partido(db, primero, 1)
+            segundo = await _partido_con_roja(
+                db, campeonato, local, visitante, jugador, jornada=3)
+            await _aplicar_partido(db, segundo, 1)
+
+            for jornada, esperado in ((2, True), (3, False), (4, True)):
+                assert await jugador_suspendido(
+                    db, jugador.id, campeonato.id, jornada) is esperado, (
+                    f"Jornada {jornada} tras finalizar ambos partidos"
+                )
+
+            segundo.estado = "En curso"
+            await _aplicar_partido(db, segundo, -1)
+
+            assert await jugador_suspendido(
+                db, jugador.id, campeonato.id, 2), (
+                "Reabrir el segundo partido anuló la sanción del primero"
+            )
+            assert not await jugador_suspendido(
+                db, jugador.id, campeonato.id, 4)
+            print("✅ La sanción del primer partido sigue vigente")
+        finally:
+            await db.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_reabrir_conserva_sanciones_de_otros_partidos())